@@ -60,7 +60,9 @@ SOFTWARE.
 
 """
 import argparse
+import bisect
 import configparser
+import errno
 import json
 import os
 import random
@@ -70,9 +72,13 @@ import string
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import uuid
 from cmd import Cmd
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
 from textwrap import TextWrapper
 
 import tzlocal
@@ -88,8 +94,12 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from rich.style import Style
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader
+    from yaml import SafeDumper
 
 APP_NAME = "nrrdtask"
 APP_VERS = "0.0.3"
@@ -100,6 +110,7 @@ DEFAULT_REMINDER = "start-15m"
 DEFAULT_FIRST_WEEKDAY = 6
 DEFAULT_DATA_DIR = f"$HOME/.local/share/{APP_NAME}"
 DEFAULT_CONFIG_FILE = f"$HOME/.config/{APP_NAME}/config"
+DEFAULT_CACHE_DIR = f"$HOME/.cache/{APP_NAME}"
 DEFAULT_CONFIG = (
     "[main]\n"
     f"data_dir = {DEFAULT_DATA_DIR}\n"
@@ -155,6 +166,180 @@ DEFAULT_CONFIG = (
     "#projectx = bright_red\n"
     "#vegasbuild = yellow\n"
 )
+ALIAS_CHARS = string.ascii_lowercase + string.digits
+# task files changed less than this many nanoseconds before the cache was
+# written are re-read, since coarse file timestamps can't tell such a
+# change apart from a later one of the same size
+CACHE_RACY_NS = 2 * 10**9
+# seconds without data file events before the shell refreshes its data
+REFRESH_DELAY = 0.25
+DURATION_REGEX = re.compile(r"(\d+)([dhm])")
+DURATION_SECONDS = {'d': 86400, 'h': 3600, 'm': 60}
+ISO_DATE_REGEX = re.compile(r"\d{4}-\d{2}-\d{2}")
+# statuses that close a task (and trigger the next recurrence)
+CLOSED_STATUSES = frozenset(['done', 'cancelled'])
+# notes placeholders from notes() that clear a task's notes
+CLEARED_NOTES = frozenset([' ', ' \n', '\n'])
+# reminder notification types
+NOTIFY_TYPES = frozenset(['display', 'email'])
+# iCalendar VTODO status for each task status (any other status is
+# exported as IN-PROCESS)
+ICAL_STATUS = {
+    'todo': 'NEEDS-ACTION',
+    'done': 'COMPLETED',
+    'cancelled': 'CANCELLED'
+}
+# (reminder prefix, iCalendar duration prefix, property) for reminders
+# relative to the start or due date (the end of a VTODO)
+ICAL_TRIGGERS = (
+    ('START-', '-PT', 'TRIGGER'),
+    ('START+', 'PT', 'TRIGGER'),
+    ('DUE-', '-PT', 'TRIGGER;RELATED=END'),
+    ('DUE+', 'PT', 'TRIGGER;RELATED=END')
+)
+# task parameters (in file order) written to task files
+TASK_FILE_FIELDS = (
+    'uid', 'created', 'updated', 'alias', 'description', 'location',
+    'priority', 'tags', 'start', 'due', 'started', 'completed', 'percent',
+    'status', 'parent', 'project', 'rrule', 'reminders', 'notes'
+)
+# task fields that may be cleared with unset
+UNSET_FIELDS = frozenset([
+    'tags', 'start', 'due', 'started', 'completed', 'priority', 'percent',
+    'parent', 'project', 'rrule', 'reminders', 'location'
+])
+# list view command aliases (shell commands match by their first three
+# characters)
+LIST_VIEW_ALIASES = {
+    'lsa': 'all',
+    'lso': 'open',
+    'lsd': 'done',
+    'lsn': 'nosubs',
+    'lss': 'soon',
+    'lsl': 'late',
+    'lst': 'today'
+}
+# fields (in column order) in the tab-delimited query() output
+QUERY_FIELDS = (
+    'uid', 'alias', 'status', 'priority', 'description', 'location',
+    'project', 'percent', 'tags', 'parent', 'start', 'due', 'started',
+    'completed'
+)
+# matches any of the field criteria in a search expression
+SEARCH_CRITERIA_REGEX = re.compile(
+    r"(?:uid|description|location|project|alias|tags|status|parent|"
+    r"priority|percent|start|due|started|completed|notes)=")
+# a search or exclude term of comma-separated 'criterion=value' pairs,
+# and the pairs within it
+SEARCH_TERM_REGEX = re.compile(r"[^,=]*=[^,=]*(?:,[^,=]*=[^,=]*)*")
+SEARCH_PAIR_REGEX = re.compile(r"([^,=]*)=([^,=]*)")
+# style attribute used for each task status
+STATUS_STYLES = {
+    'done': 'style_status_done',
+    'todo': 'style_status_todo',
+    'inprogress': 'style_status_inprogress',
+    'waiting': 'style_status_waiting',
+    'onhold': 'style_status_onhold',
+    'blocked': 'style_status_blocked',
+    'cancelled': 'style_status_cancelled'
+}
+# (style attribute, color attribute, bold) for each output style. A
+# bold value of True follows the 'disable_bold' setting and a color
+# attribute of None uses the terminal default color.
+STYLE_COLORS = (
+    ('style_title', 'color_title', True),
+    ('style_description', 'color_description', None),
+    ('style_location', 'color_location', None),
+    ('style_alias', 'color_alias', None),
+    ('style_tags', 'color_tags', None),
+    ('style_parent', 'color_parent', None),
+    ('style_label', 'color_label', None),
+    ('style_date', 'color_date', None),
+    ('style_date_soon', 'color_date_soon', True),
+    ('style_date_late', 'color_date_late', True),
+    ('style_status_done', 'color_status_done', True),
+    ('style_status_todo', 'color_status_todo', True),
+    ('style_status_inprogress', 'color_status_inprogress', True),
+    ('style_status_waiting', 'color_status_waiting', True),
+    ('style_status_onhold', 'color_status_onhold', True),
+    ('style_status_blocked', 'color_status_blocked', True),
+    ('style_status_cancelled', 'color_status_cancelled', True),
+    ('style_status_default', None, True),
+    ('style_priority_low', 'color_priority_low', None),
+    ('style_priority_normal', 'color_priority_normal', None),
+    ('style_priority_medium', 'color_priority_medium', None),
+    ('style_priority_high', 'color_priority_high', None),
+    ('style_percent', 'color_percent', None),
+    ('style_percent_100', 'color_percent_100', True),
+    ('style_flag', 'color_flag', True),
+    ('style_date_done', 'color_date', False)
+)
+# options for the titled tables in list and info output
+SECTION_TABLE_OPTIONS = {
+    'title_justify': "left",
+    'box': box.SIMPLE,
+    'show_header': False,
+    'show_lines': False,
+    'pad_edge': False,
+    'collapse_padding': False,
+    'padding': (0, 0, 0, 0)
+}
+# options for the indented subtask tables in tree views
+SUBTASK_TABLE_OPTIONS = {
+    'title': None,
+    'box': None,
+    'show_header': False,
+    'show_lines': False,
+    'pad_edge': True,
+    'collapse_padding': False,
+    'padding': (0, 0, 0, 4)
+}
+RRULE_CRITERIA = frozenset([
+    'date',         # specific recurrence dates
+    'except',       # specific exception dates
+    'freq',         # frequency (minutely, hourly, daily, weekly,
+                    #   monthly, yearly)
+    'count',        # number of recurrences
+    'until',        # recur until date
+    'interval',     # interval of recurrence
+    'byhour',       # recur by hour (0-23)
+    'byweekday',    # SU, MO, TU, WE, TH, FR, SA
+    'bymonth',      # recur by month (1-12)
+    'bymonthday',   # day of month (1-31)
+    'byyearday',    # day of the year (1-366)
+    'byweekno',     # week of year (1-53)
+    'bysetpos'      # set position of occurence set (e.g., 1 for
+                    #   first, -1 for last, -2 for second to last)
+])
+RRULE_REGEX = re.compile(r"(\w+)\s*=\s*([^;]*)")
+# valid (min, max) for integer rrule criteria, or None if unlimited
+RRULE_INTEGER_RANGES = {
+    'count': None,
+    'interval': None,
+    'byhour': (0, 23),
+    'bymonth': (1, 12),
+    'bymonthday': (1, 31),
+    'byyearday': (1, 366),
+    'byweekno': (1, 53),
+    'bysetpos': None
+}
+RRULE_FREQUENCIES = {
+    'MINUTELY': MINUTELY,
+    'HOURLY': HOURLY,
+    'DAILY': DAILY,
+    'WEEKLY': WEEKLY,
+    'MONTHLY': MONTHLY,
+    'YEARLY': YEARLY
+}
+RRULE_WEEKDAYS = {
+    'SU': SU,
+    'MO': MO,
+    'TU': TU,
+    'WE': WE,
+    'TH': TH,
+    'FR': FR,
+    'SA': SA
+}
 
 
 class Tasks():
@@ -164,17 +349,22 @@ class Tasks():
         config_file (str):  application config file.
         data_dir (str):     directory containing task files.
         dflt_config (str):  the default config if none is present.
+        cache_file (str):   file for caching parsed task file data
+    (optional).
 
     """
     def __init__(
             self,
             config_file,
             data_dir,
-            dflt_config):
+            dflt_config,
+            cache_file=None):
         """Initializes a Tasks() object."""
         self.config_file = config_file
         self.data_dir = data_dir
+        self.cache_file = cache_file
         self.config_dir = os.path.dirname(self.config_file)
+        self.config_signature = None
         self.dflt_config = dflt_config
         self.interactive = False
 
@@ -206,6 +396,7 @@ class Tasks():
         self.color_bold = True
         self.color_pager = False
         self.project_colors = None
+        self.project_styles = {}
         self.color_enabled = True
 
         # default settings
@@ -253,9 +444,44 @@ class Tasks():
         self.style_percent_100 = None
         self.style_flag = None
 
+        # styles keyed by task status, and priority styles with their
+        # thresholds (built with the styles above)
+        self.status_styles = {}
+        self.priority_thresholds = ()
+        self.priority_styles = ()
+
         # parent tasks
         self.parents = {}
 
+        # task uids, keyed by (lower-case) alias
+        self.alias_index = {}
+
+        # pre-styled labels for task output
+        self.format_labels = {}
+
+        # console for rich output
+        self.console = Console()
+
+        # parsed task data, keyed by uid
+        self.task_cache = {}
+
+        # rrule objects, keyed by rule parameters and start datetime
+        self.rrule_cache = {}
+
+        # parsed datetimes, keyed by datetime string
+        self.datetime_cache = {}
+
+        # formatted timestamps, keyed by datetime, tzinfo and format
+        self.timestamp_cache = {}
+
+        # start/due date, status, project, tag and priority indexes
+        # (built on demand)
+        self.date_index = None
+        self.status_index = None
+        self.project_index = None
+        self.tag_index = None
+        self.priority_rank = None
+
         self._default_config()
         self._parse_config()
         self._verify_data_dir()
@@ -270,6 +496,43 @@ class Tasks():
         """
         self._handle_error(f"Alias '{alias}' not found")
 
+    def _apply_colors(self, fallback=None):
+        """Create the output styles from the current colors, catching
+        exceptions for invalid color names.
+
+        Args:
+            fallback (dict):    colors to use in place of invalid ones,
+        keyed by color attribute (optional).
+
+        """
+        for style_attr, color_attr, bold in STYLE_COLORS:
+            if bold:
+                bold = self.color_bold
+            colors = [getattr(self, color_attr) if color_attr else "default"]
+            if fallback and color_attr in fallback:
+                colors.append(fallback[color_attr])
+            for color in colors:
+                try:
+                    setattr(self, style_attr, Style(color=color, bold=bold))
+                except ColorParseError:
+                    continue
+                break
+        self.status_styles = {}
+        for status, style_attr in STATUS_STYLES.items():
+            self.status_styles[status] = getattr(self, style_attr)
+        # cumulative maximums keep the thresholds sorted for bisect and
+        # match the high/medium/normal precedence if they are not
+        self.priority_thresholds = (
+            self.priority_high,
+            max(self.priority_high, self.priority_medium),
+            max(self.priority_high, self.priority_medium,
+                self.priority_normal))
+        self.priority_styles = (
+            self.style_priority_high,
+            self.style_priority_medium,
+            self.style_priority_normal,
+            self.style_priority_low)
+
     def _build_flat(
             self,
             tasklist,
@@ -288,19 +551,93 @@ class Tasks():
             flat (dict):     the flat list of tasks.
 
         """
+        passing = self._filter_uids(filtexp)
+        if project:
+            passing = passing.intersection(self._project_uids(project))
+        tasklist = [uid for uid in tasklist if uid in passing]
         uids = self._sort_tasks(tasklist, sortby)
         flat = {}
         for uid in uids:
-            task = self._parse_task(uid)
-            add_task = True
-            if project:
-                if project != task['project']:
-                    add_task = False
-            if add_task:
-                if self._pass_filter(filtexp, task['status']):
-                    flat[uid] = []
+            flat[uid] = []
         return flat
 
+    def _build_rrule(self, rruleobj, dt_start):
+        """Builds a dateutil rrule object from a dict of recurrence
+        rule parameters and a start datetime.
+
+        Args:
+            rruleobj (dict):    a dict of recurrence rule parameters.
+            dt_start (obj):     the start datetime.
+
+        Returns:
+            rule (obj):     the rrule object (or None if the rule has no
+        valid frequency).
+
+        """
+        # the 'date' and 'except' lists are applied outside of the
+        # rrule object and are not part of the key
+        try:
+            cache_key = (
+                tuple((key, value) for key, value in rruleobj.items()
+                      if key not in ['date', 'except']),
+                dt_start)
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+        if cache_key and cache_key in self.rrule_cache:
+            return self.rrule_cache[cache_key]
+
+        rr_freqstr = rruleobj.get('freq')
+        if rr_freqstr:
+            rr_freqstr = rr_freqstr.upper()
+            rr_freq = RRULE_FREQUENCIES.get(rr_freqstr)
+        else:
+            rr_freq = None
+        rr_count = rruleobj.get('count')
+        if not rr_count:
+            rr_count = self.recurrence_limit
+        rr_until = rruleobj.get('until')
+        rr_interval = rruleobj.get('interval')
+        if not rr_interval:
+            rr_interval = 1
+        rr_byminute = rruleobj.get('byminute')
+        rr_byhour = rruleobj.get('byhour')
+        rr_byweekdaystr = rruleobj.get('byweekday')
+        if rr_byweekdaystr:
+            rr_byweekdaystr = rr_byweekdaystr.upper()
+            rr_byweekday = RRULE_WEEKDAYS.get(rr_byweekdaystr)
+        else:
+            rr_byweekday = None
+        rr_bymonth = rruleobj.get('bymonth')
+        rr_bymonthday = rruleobj.get('bymonthday')
+        rr_byyearday = rruleobj.get('byyearday')
+        rr_byweekno = rruleobj.get('byweekno')
+        rr_bysetpos = rruleobj.get('bysetpos')
+
+        # YEARLY is 0, so test against None rather than truthiness
+        if rr_freq is not None:
+            rule = rr_rrule(rr_freq,
+                            dtstart=dt_start,
+                            interval=rr_interval,
+                            wkst=self.first_weekday,
+                            count=rr_count,
+                            until=rr_until,
+                            bysetpos=rr_bysetpos,
+                            bymonth=rr_bymonth,
+                            bymonthday=rr_bymonthday,
+                            byyearday=rr_byyearday,
+                            byweekno=rr_byweekno,
+                            byweekday=rr_byweekday,
+                            byhour=rr_byhour,
+                            byminute=rr_byminute,
+                            cache=True)
+        else:
+            rule = None
+
+        if cache_key:
+            self.rrule_cache[cache_key] = rule
+        return rule
+
     def _build_tree(
             self,
             tasklist,
@@ -321,26 +658,23 @@ class Tasks():
             tree (dict):    the hierarchal tree of tasks.
 
         """
+        passing = self._filter_uids(filtexp)
+        members = passing
+        if project:
+            members = members.intersection(self._project_uids(project))
+        tasklist = [uid for uid in tasklist if uid in members]
         uids = self._sort_tasks(tasklist, sortby)
         tree = {}
         for uid in uids:
             task = self._parse_task(uid)
-            add_task = True
-            if project:
-                if project != task['project']:
-                    add_task = False
-            if add_task:
-                if (not task['parent'] and
-                        self._pass_filter(filtexp, task['status'])):
-                    tree[uid] = []
-                    if subs and uid in self.parents:
-                        subtasks = self.parents[uid]
-                        children = self._sort_tasks(subtasks, sortby)
-                        for child in children:
-                            subtask = self._parse_task(child)
-                            if self._pass_filter(
-                                    filtexp, subtask['status']):
-                                tree[uid].append(child)
+            if not task['parent']:
+                tree[uid] = []
+                if subs and uid in self.parents:
+                    # only sort the subtasks that pass the filter
+                    subtasks = [child for child in self.parents[uid]
+                                if child in passing]
+                    if subtasks:
+                        tree[uid] = list(self._sort_tasks(subtasks, sortby))
         return tree
 
     def _calc_duration(self, expression):
@@ -355,14 +689,13 @@ class Tasks():
             duration (int):      the duration in seconds.
 
         """
-        expression = expression.lower()
-        d_search = re.search(r"\d+d", expression)
-        h_search = re.search(r"\d+h", expression)
-        m_search = re.search(r"\d+m", expression)
-        days = int(d_search[0].replace('d', '')) if d_search else 0
-        hours = int(h_search[0].replace('h', '')) if h_search else 0
-        minutes = int(m_search[0].replace('m', '')) if m_search else 0
-        duration = (days*86400) + (hours*3600) + (minutes*60)
+        units = {}
+        for amount, unit in DURATION_REGEX.findall(expression.lower()):
+            # the first amount given for each unit is used
+            units.setdefault(unit, int(amount))
+        duration = 0
+        for unit, amount in units.items():
+            duration += amount*DURATION_SECONDS[unit]
 
         if duration == 0:
             duration = self.default_duration*60
@@ -383,15 +716,28 @@ class Tasks():
             next_due (obj):     the next due datetime.
 
         """
-        recurrences = self._calc_task_recurrences(rrule, dt_start)
+        rule = self._build_rrule(rrule, dt_start)
         next_start = None
         next_due = None
-        if recurrences:
-            for next_dt in recurrences:
-                if next_dt > dt_start:
+        if rule:
+            # the next recurrence is the first one after the start
+            # datetime that is not in the past
+            now = datetime.now(tz=self.ltz)
+            if now > dt_start:
+                after, inclusive = now, True
+            else:
+                after, inclusive = dt_start, False
+            excluded = set(self._rrule_dates(rrule, 'except'))
+            for next_dt in rule.xafter(after, inc=inclusive):
+                if next_dt not in excluded:
                     next_start = next_dt
                     break
-            if dt_due:
+            for next_dt in self._rrule_dates(rrule, 'date'):
+                if ((next_dt > after or (inclusive and next_dt == after))
+                        and next_dt not in excluded):
+                    if not next_start or next_dt < next_start:
+                        next_start = next_dt
+            if next_start and dt_due:
                 duration = dt_due - dt_start
                 next_due = next_start + duration
 
@@ -473,97 +819,163 @@ class Tasks():
 
         """
         now = datetime.now(tz=self.ltz)
-        rr_freqstr = rruleobj.get('freq')
-        frequencies = {
-            'MINUTELY': MINUTELY,
-            'HOURLY': HOURLY,
-            'DAILY': DAILY,
-            'WEEKLY': WEEKLY,
-            'MONTHLY': MONTHLY,
-            'YEARLY': YEARLY
-        }
-        weekdays = {
-            'SU': SU,
-            'MO': MO,
-            'TU': TU,
-            'WE': WE,
-            'TH': TH,
-            'FR': FR,
-            'SA': SA
-        }
-        if rr_freqstr:
-            rr_freqstr = rr_freqstr.upper()
-            rr_freq = frequencies.get(rr_freqstr)
-        else:
-            rr_freq = None
-        rr_count = rruleobj.get('count')
-        if not rr_count:
-            rr_count = self.recurrence_limit
-        rr_until = rruleobj.get('until')
-        rr_interval = rruleobj.get('interval')
-        if not rr_interval:
-            rr_interval = 1
-        rr_byminute = rruleobj.get('byminute')
-        rr_byhour = rruleobj.get('byhour')
-        rr_byweekdaystr = rruleobj.get('byweekday')
-        if rr_byweekdaystr:
-            rr_byweekdaystr = rr_byweekdaystr.upper()
-            rr_byweekday = weekdays.get(rr_byweekdaystr)
-        else:
-            rr_byweekday = None
-        rr_bymonth = rruleobj.get('bymonth')
-        rr_bymonthday = rruleobj.get('bymonthday')
-        rr_byyearday = rruleobj.get('byyearday')
-        rr_byweekno = rruleobj.get('byweekno')
-        rr_bysetpos = rruleobj.get('bysetpos')
-        rr_date = rruleobj.get('date')
-        rr_except = rruleobj.get('except')
-
-        if rr_freq:
-            all_recurrences = list(rr_rrule(rr_freq,
-                                            dtstart=dt_start,
-                                            interval=rr_interval,
-                                            wkst=self.first_weekday,
-                                            count=rr_count,
-                                            until=rr_until,
-                                            bysetpos=rr_bysetpos,
-                                            bymonth=rr_bymonth,
-                                            bymonthday=rr_bymonthday,
-                                            byyearday=rr_byyearday,
-                                            byweekno=rr_byweekno,
-                                            byweekday=rr_byweekday,
-                                            byhour=rr_byhour,
-                                            byminute=rr_byminute))
+        rule = self._build_rrule(rruleobj, dt_start)
+        if rule:
+            if past:
+                all_recurrences = list(rule)
+            else:
+                # skip generating the entries that are in the past
+                all_recurrences = list(rule.xafter(now, inc=True))
+            all_recurrences = set(all_recurrences)
             # add any specifically defined recurrences
-            if rr_date:
-                for entry in rr_date:
-                    new_dt = self._datetime_or_none(entry)
-                    if new_dt:
-                        if new_dt not in all_recurrences:
-                            all_recurrences.append(new_dt)
+            for new_dt in self._rrule_dates(rruleobj, 'date'):
+                if past or new_dt >= now:
+                    all_recurrences.add(new_dt)
             # remove any specifically excluded recurences
-            if rr_except:
-                for entry in rr_except:
-                    new_dt = self._datetime_or_none(entry)
-                    if new_dt:
-                        if new_dt in all_recurrences:
-                            all_recurrences.remove(new_dt)
+            all_recurrences.difference_update(
+                self._rrule_dates(rruleobj, 'except'))
 
-            all_recurrences.sort()
-
-            if past:
-                recurrences = all_recurrences.copy()
-            else:
-                recurrences = []
-                # remove any entries that are in the past
-                for entry in all_recurrences:
-                    if entry >= now:
-                        recurrences.append(entry)
+            recurrences = sorted(all_recurrences)
         else:
             recurrences = None
 
         return recurrences
 
+    def _config_signature(self):
+        """Get the modification time and size of the config file.
+
+        Returns:
+            signature (tuple):  (mtime_ns, size) of the config file, or
+        None if it cannot be read.
+
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            signature = None
+        else:
+            signature = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def _create_task(
+            self,
+            description=None,
+            location=None,
+            priority=None,
+            tags=None,
+            start=None,
+            due=None,
+            started=None,
+            completed=None,
+            percent=None,
+            status=None,
+            parent=None,
+            project=None,
+            rrule=None,
+            reminders=None,
+            notes=None):
+        """Write a new task file from already-parsed task parameters.
+
+        Args:
+            description (str):  task description.
+            location (str):     task location.
+            priority (int):     task priority (1 is highest).
+            tags (list):        tags assigned to the task.
+            start (obj):        task start datetime.
+            due (obj):          task due datetime.
+            started (obj):      task started datetime.
+            completed (obj):    task completed datetime.
+            percent (int):      task percent complete.
+            status (str):       task status (todo, done, ...).
+            parent (str):       parent task (making this a subtask).
+            project (str):      task is associated with a project.
+            rrule (dict):       task recurrence parameters.
+            reminders (list):   task reminders.
+            notes (str):        notes assigned to the task.
+
+        """
+        # check parent for existing alias
+        if parent:
+            if parent.lower() not in self.alias_index:
+                self._error_pass(f"parent '{parent.lower()}' not found")
+                parent = None
+        # set defaults for empty parameters that shouldn't be empty
+        description = description or "New task"
+        status = status or "todo"
+
+        uid = str(uuid.uuid4())
+        now = datetime.now(tz=self.ltz)
+        created = now
+        updated = now
+        alias = self._gen_alias()
+        filename = os.path.join(self.data_dir, f'{uid}.yml')
+        data = {
+            "task": {
+                "uid": uid,
+                "created": created,
+                "updated": updated,
+                "alias": alias,
+                "description": description,
+                "location": location,
+                "priority": priority,
+                "tags": tags,
+                "start": start,
+                "due": due,
+                "started": started,
+                "completed": completed,
+                "percent": percent,
+                "status": status,
+                "parent": parent,
+                "project": project,
+                "rrule": rrule,
+                "reminders": reminders,
+                "notes": notes
+            }
+        }
+        # write the updated file
+        self._write_yaml_file(data, filename)
+        print(f"Added task: {alias}")
+
+    def _date_range(self, field, start=None, end=None, whole_days=False):
+        """Find the tasks with a start or due date in a given range
+        using the sorted date index.
+
+        Args:
+            field (str):        the date field ('start' or 'due').
+            start (obj):        datetime the dates must be after
+        (optional).
+            end (obj):          datetime the dates must be at or before
+        (optional).
+            whole_days (bool):  match any time on the calendar days of
+        start through end instead (optional).
+
+        Returns:
+            uids (list):    the uids of matching tasks, in date order.
+
+        """
+        if self.date_index is None:
+            self._make_indexes()
+        dates, uids = self.date_index[field]
+        if whole_days:
+            if start:
+                start = start.replace(
+                    hour=0, minute=0, second=0, microsecond=0)
+                first = bisect.bisect_left(dates, start)
+            if end:
+                end = (end.replace(hour=0, minute=0, second=0,
+                                   microsecond=0) + timedelta(days=1))
+                last = bisect.bisect_left(dates, end)
+        else:
+            if start:
+                first = bisect.bisect_right(dates, start)
+            if end:
+                last = bisect.bisect_right(dates, end)
+        if not start:
+            first = 0
+        if not end:
+            last = len(dates)
+        return uids[first:last]
+
     def _datetime_or_none(self, timestr):
         """Verify a datetime object or a datetime string in ISO format
         and return a datetime object or None.
@@ -575,13 +987,35 @@ class Tasks():
             timeobj (datetime): a valid datetime object or None.
 
         """
+        timeobj = None
         if isinstance(timestr, datetime):
-            timeobj = timestr.astimezone(tz=self.ltz)
+            if timestr.tzinfo is self.ltz:
+                # already converted (e.g., a previously parsed value)
+                timeobj = timestr
+            else:
+                timeobj = timestr.astimezone(tz=self.ltz)
+        elif isinstance(timestr, str) and timestr in self.datetime_cache:
+            timeobj = self.datetime_cache[timestr]
         else:
-            try:
-                timeobj = dtparser.parse(timestr).astimezone(tz=self.ltz)
-            except (TypeError, ValueError, dtparser.ParserError):
-                timeobj = None
+            # try the (much faster) standard ISO format parser first
+            full_date = (isinstance(timestr, str) and
+                         ISO_DATE_REGEX.match(timestr))
+            if full_date:
+                try:
+                    timeobj = datetime.fromisoformat(
+                        timestr).astimezone(tz=self.ltz)
+                except ValueError:
+                    pass
+            if not timeobj:
+                try:
+                    timeobj = dtparser.parse(
+                        timestr).astimezone(tz=self.ltz)
+                except (TypeError, ValueError, dtparser.ParserError):
+                    timeobj = None
+            # strings without a full date are completed from the current
+            # date by dateutil, so only cache those with one
+            if full_date:
+                self.datetime_cache[timestr] = timeobj
         return timeobj
 
     def _default_config(self):
@@ -620,6 +1054,30 @@ class Tasks():
         """
         print(f'ERROR: {errormsg}.')
 
+    def _filter_uids(self, condition):
+        """Get the uids of tasks with a status that passes a predefined
+        condition, using the status index.
+
+        Args:
+            condition (str):    the condition profile ('done', 'open',
+        or None for no filter).
+
+        Returns:
+            uids (set): the uids of tasks that pass the filter.
+
+        """
+        if condition == 'done':
+            statuses = ['done']
+        elif condition == 'open':
+            statuses = CLOSED_STATUSES
+        else:
+            statuses = []
+        uids = self._status_uids(statuses, exclude=condition != 'done')
+        # tasks with no status can't meet any condition
+        for status in [None, '']:
+            uids = uids.difference(self.status_index.get(status, set()))
+        return uids
+
     def _find_late(self):
         """Build a list of tasks that are overdue to start or finish.
 
@@ -628,33 +1086,29 @@ class Tasks():
 
         """
         now = datetime.now(tz=self.ltz)
-        uids = self._sort_tasks(self.tasks, 'priority')
+        yesterday = now - timedelta(days=1)
+        matches = set()
+        for field, statuses in [
+                ('start', self._status_uids(['todo'])),
+                ('due', self._status_uids(
+                    CLOSED_STATUSES, exclude=True))]:
+            # midnight start/due times are treated as 23:59 so a task
+            # is not late until the end of the day, but anything
+            # before today is late either way
+            matches |= statuses.intersection(
+                self._date_range(field, end=yesterday, whole_days=True))
+            for uid in statuses.intersection(
+                    self._date_range(field, start=now, end=now,
+                                     whole_days=True)):
+                taskdate = self._parse_task(uid)[field]
+                if taskdate.hour == 0 and taskdate.minute == 0:
+                    taskdate = taskdate.replace(hour=23, minute=59)
+                if taskdate <= now:
+                    matches.add(uid)
+        uids = self._rank_by_priority(matches)
         tasks_late = {}
         for uid in uids:
-            task = self._parse_task(uid)
-            is_late = False
-            start = task['start']
-            due = task['due']
-            if start:
-                if start.hour == 0 and start.minute == 0:
-                    start = start.replace(hour=23, minute=59)
-            if due:
-                if due.hour == 0 and due.minute == 0:
-                    due = due.replace(hour=23, minute=59)
-            try:
-                if (task['status'] == "todo" and
-                        start <= now):
-                    is_late = True
-            except TypeError:
-                pass
-            try:
-                if (task['status'] not in ["done", "cancelled"] and
-                        due <= now):
-                    is_late = True
-            except TypeError:
-                pass
-            if is_late:
-                tasks_late[uid] = []
+            tasks_late[uid] = []
         return tasks_late
 
     def _find_soon(self):
@@ -666,25 +1120,16 @@ class Tasks():
         """
         now = datetime.now(tz=self.ltz)
         soon = now + timedelta(days=self.days_soon)
-        uids = self._sort_tasks(self.tasks, 'priority')
+        matches = set()
+        for field, statuses in [
+                ('start', self._status_uids(['todo'])),
+                ('due', self._status_uids(['done'], exclude=True))]:
+            matches |= statuses.intersection(
+                self._date_range(field, start=now, end=soon))
+        uids = self._rank_by_priority(matches)
         tasks_soon = {}
         for uid in uids:
-            task = self._parse_task(uid)
-            is_soon = False
-            try:
-                if (task['status'] == "todo" and
-                        now < task['start'] <= soon):
-                    is_soon = True
-            except TypeError:
-                pass
-            try:
-                if (task['status'] != "done" and
-                        now < task['due'] <= soon):
-                    is_soon = True
-            except TypeError:
-                pass
-            if is_soon:
-                tasks_soon[uid] = []
+            tasks_soon[uid] = []
         return tasks_soon
 
     def _find_today(self):
@@ -695,25 +1140,17 @@ class Tasks():
 
         """
         now = datetime.now(tz=self.ltz)
-        uids = self._sort_tasks(self.tasks, 'priority')
+        matches = set()
+        for field, statuses in [
+                ('start', self._status_uids(['todo'])),
+                ('due', self._status_uids(['done'], exclude=True))]:
+            matches |= statuses.intersection(
+                self._date_range(field, start=now, end=now,
+                                 whole_days=True))
+        uids = self._rank_by_priority(matches)
         tasks_today = {}
         for uid in uids:
-            task = self._parse_task(uid)
-            is_today = False
-            try:
-                if (task['status'] == "todo" and
-                        task['start'].date() == now.date()):
-                    is_today = True
-            except (AttributeError, TypeError):
-                pass
-            try:
-                if (task['status'] != "done" and
-                        task['due'].date() == now.date()):
-                    is_today = True
-            except (AttributeError, TypeError):
-                pass
-            if is_today:
-                tasks_today[uid] = []
+            tasks_today[uid] = []
         return tasks_today
 
     def _format_task(
@@ -721,7 +1158,9 @@ class Tasks():
             uid,
             subtask=False,
             parent=False,
-            project=None):
+            project=None,
+            now=None,
+            soon=None):
         """Format task output for a given task.
 
         Args:
@@ -729,96 +1168,68 @@ class Tasks():
             subtask (bool): the task is a subtask in tree view.
             parent (bool): the task is a parent with subtasks.
             project (str): the task is in a project list.
+            now (obj):     the current datetime (optional).
+            soon (obj):    the datetime for dates that are 'soon'
+        (optional).
 
         Returns:
             output (str):   the formatted output.
 
         """
         task = self._parse_task(uid)
+        labels = self.format_labels
+        prefix = "\n   + "
 
         # primary line
-        if task['notes']:
-            notesflag = Text("*")
-            notesflag.stylize(self.style_flag)
-        else:
-            notesflag = ""
-
-        if task['rrule'] and task['start']:
-            recurflag = Text("@")
-            recurflag.stylize(self.style_flag)
-        else:
-            recurflag = ""
-
-        if task['description']:
-            descriptiontxt = Text(task['description'])
-            descriptiontxt.stylize(self.style_description)
-        else:
-            descriptiontxt = ""
-
-        aliastxt = Text(f"({task['alias']}) ")
-        aliastxt.stylize(self.style_alias)
-
+        output = Text("- ")
+        output.append(f"({task['alias']}) ", style=self.style_alias)
         if task['status']:
-            statustxt = self._stylize_by_status(
-                f"[{task['status'].upper()}] ", task['status'])
-        else:
-            statustxt = ""
-
+            output.append(f"[{task['status'].upper()}] ",
+                          style=self._status_style(task['status']))
         if task['priority']:
-            prioritytxt = self._stylize_by_priority(
-                f"[{task['priority']}] ", task['priority'])
-        else:
-            prioritytxt = ""
-
+            output.append(f"[{task['priority']}] ",
+                          style=self._priority_style(task['priority']))
+        if task['description']:
+            output.append(task['description'],
+                          style=self.style_description)
+        if task['notes']:
+            output.append(labels['notes'])
         if task['percent']:
-            percenttxt = Text(f" ({task['percent']}%)")
             if task['percent'] == 100:
-                percenttxt.stylize(self.style_percent_100)
+                percentstyle = self.style_percent_100
             else:
-                percenttxt.stylize(self.style_percent)
-        else:
-            percenttxt = ""
+                percentstyle = self.style_percent
+            output.append(f" ({task['percent']}%)", style=percentstyle)
 
         # location line
         if task['location']:
-            locationlabel = Text("location: ")
-            locationlabel.stylize(self.style_label)
-            locationfield = Text(task['location'])
-            locationfield.stylize(self.style_location)
-            locationline = Text.assemble(
-                "\n   + ", locationlabel, locationfield)
-        else:
-            locationline = ""
+            output.append(prefix)
+            output.append(labels['location'])
+            output.append(task['location'], style=self.style_location)
 
         # project line
         if task['project'] and not project and not subtask:
-            projectlabel = Text("project: ")
-            projectlabel.stylize(self.style_label)
-            projecttxt = Text(task['project'])
-            projecttxt.stylize(self._make_project_style(task['project']))
-            projectline = Text.assemble(
-                "\n   + ", projectlabel, projecttxt)
-        else:
-            projectline = ""
+            output.append(prefix)
+            output.append(labels['project'])
+            output.append(
+                task['project'],
+                style=self._make_project_style(task['project']))
 
         # tag line
         if task['tags']:
-            taglabel = Text("tags: ")
-            taglabel.stylize(self.style_label)
-            tagfield = Text(','.join(task['tags']))
-            tagfield.stylize(self.style_tags)
-            tagline = Text.assemble(
-                "\n   + ", taglabel, tagfield)
-        else:
-            tagline = ""
+            output.append(prefix)
+            output.append(labels['tags'])
+            output.append(','.join(task['tags']), style=self.style_tags)
 
         # date line
-        now = datetime.now(tz=self.ltz)
-        soon = now + timedelta(days=self.days_soon)
+        if not now:
+            now = datetime.now(tz=self.ltz)
+        if not soon:
+            soon = now + timedelta(days=self.days_soon)
 
+        if task['start'] or task['due']:
+            output.append(prefix)
         if task['start']:
-            startlabel = Text("start: ")
-            startlabel.stylize(self.style_label)
             startdate = Text(self._format_timestamp(task['start'], True))
             startdate.stylize(self.style_date)
             if task['status']:
@@ -827,14 +1238,12 @@ class Tasks():
                         startdate.stylize(self.style_date_late)
                     elif task['start'] <= soon:
                         startdate.stylize(self.style_date_soon)
-            starttxt = Text.assemble(
-                    startlabel, startdate, recurflag, "  ")
-
-        else:
-            starttxt = ""
+            output.append(labels['start'])
+            output.append(startdate)
+            if task['rrule']:
+                output.append(labels['recur'])
+            output.append("  ")
         if task['due']:
-            duelabel = Text("due: ")
-            duelabel.stylize(self.style_label)
             duedate = Text(self._format_timestamp(task['due'], True))
             if task['due'] <= now:
                 duedate.stylize(self.style_date_late)
@@ -845,90 +1254,71 @@ class Tasks():
             if task['status']:
                 if task['status'] == "done":
                     duedate.stylize(self.style_date_done)
-            duetxt = Text.assemble(duelabel, duedate, "  ")
-        else:
-            duetxt = ""
-        if task['start'] or task['due']:
-            dateline = Text.assemble(
-                "\n   + ",
-                starttxt,
-                duetxt)
-        else:
-            dateline = ""
+            output.append(labels['due'])
+            output.append(duedate)
+            output.append("  ")
 
         # history line
+        if task['started'] or task['completed']:
+            output.append(prefix)
         if task['started']:
-            startedlabel = Text("started: ")
-            startedlabel.stylize(self.style_label)
-            starteddate = Text(self._format_timestamp(task['started'], True))
-            starteddate.stylize(self.style_date)
-            startedtxt = Text.assemble(
-                startedlabel,
-                starteddate,
-                "  ")
-        else:
-            startedtxt = ""
+            output.append(labels['started'])
+            output.append(self._format_timestamp(task['started'], True),
+                          style=self.style_date)
+            output.append("  ")
         if task['completed']:
-            complabel = Text("completed: ")
-            complabel.stylize(self.style_label)
-            compdate = Text(self._format_timestamp(task['completed'], True))
-            compdate.stylize(self.style_date)
-            completedtxt = Text.assemble(complabel, compdate)
-        else:
-            completedtxt = ""
-        if task['started'] or task['completed']:
-            historyline = Text.assemble(
-                "\n   + ",
-                startedtxt,
-                completedtxt)
-        else:
-            historyline = ""
+            output.append(labels['completed'])
+            output.append(self._format_timestamp(task['completed'], True),
+                          style=self.style_date)
 
         # parent line (for flat view)
         if task['parent'] and not subtask:
-            parentlabel = Text("parent: ")
-            parentlabel.stylize(self.style_label)
-            parentfield = Text(task['parent'])
-            parentfield.stylize(self.style_parent)
-            parentline = Text.assemble(
-                "\n   + ",
-                parentlabel,
-                parentfield)
-        else:
-            parentline = ""
+            output.append(prefix)
+            output.append(labels['parent'])
+            output.append(task['parent'], style=self.style_parent)
 
         # subtasks line
         if parent:
-            subtaskslabel = Text("subtasks: ")
-            subtaskslabel.stylize(self.style_label)
-            subtasksline = Text.assemble(
-                "\n   + ",
-                subtaskslabel)
-        else:
-            subtasksline = ""
-
-        # assemble lines into task block
-        output = Text.assemble(
-            "- ",
-            aliastxt,
-            statustxt,
-            prioritytxt,
-            descriptiontxt,
-            notesflag,
-            percenttxt,
-            locationline,
-            projectline,
-            tagline,
-            dateline,
-            historyline,
-            parentline,
-            subtasksline)
+            output.append(prefix)
+            output.append(labels['subtasks'])
 
         return output
 
-    @staticmethod
-    def _format_timestamp(timeobj, pretty=False):
-        """Convert a datetime obj to a string.
+    def _format_task_batch(self, tasks, project=None):
+        """Format the rows of a task list or tree in a single pass.
+
+        Args:
+            tasks (dict):   the dict of tasks (and subtasks) to format.
+            project (str):  the tasks are in a project list.
+
+        Returns:
+            rows (list):    the rich renderables for each table row.
+
+        """
+        now = datetime.now(tz=self.ltz)
+        soon = now + timedelta(days=self.days_soon)
+        rows = []
+        for task, subtasks in tasks.items():
+            if subtasks:
+                rows.append(self._format_task(
+                    task,
+                    parent=True,
+                    project=project,
+                    now=now,
+                    soon=soon))
+                subtask_table = Table(**SUBTASK_TABLE_OPTIONS)
+                for subtask in subtasks:
+                    subtask_table.add_row(self._format_task(
+                        subtask, subtask=True, now=now, soon=soon))
+                rows.append(subtask_table)
+            else:
+                rows.append(self._format_task(task, now=now, soon=soon))
+            rows.append("")
+        return rows
+
+    def _format_timestamp(self, timeobj, pretty=False):
+        """Convert a datetime obj to a string. Results are cached in
+        `timestamp_cache`.
 
         Args:
             timeobj (datetime): a datetime object.
@@ -938,13 +1328,20 @@ class Tasks():
             timestamp (str): "%Y-%m-%d %H:%M:%S" or "%Y-%m-%d[ %H:%M]".
 
         """
-        if pretty:
-            if timeobj.strftime("%H:%M") == "00:00":
-                timestamp = timeobj.strftime("%Y-%m-%d")
+        # aware datetimes compare by instant, so the tzinfo is part of
+        # the key to keep equal instants in other zones apart
+        key = (timeobj, timeobj.tzinfo, pretty)
+        timestamp = self.timestamp_cache.get(key)
+        if timestamp is None:
+            # isoformat() on the date and (naive) time parts avoids the
+            # slower strftime() and leaves out the UTC offset
+            timestamp = timeobj.date().isoformat()
+            if pretty:
+                if timeobj.hour or timeobj.minute:
+                    timestamp += f" {timeobj.time().isoformat('minutes')}"
             else:
-                timestamp = timeobj.strftime("%Y-%m-%d %H:%M")
-        else:
-            timestamp = timeobj.strftime("%Y-%m-%d %H:%M:%S")
+                timestamp += f" {timeobj.time().isoformat('seconds')}"
+            self.timestamp_cache[key] = timestamp
         return timestamp
 
     def _gen_alias(self):
@@ -954,28 +1351,12 @@ class Tasks():
             alias (str):    a randomly-generated alias.
 
         """
-        aliases = self._get_aliases()
-        chars = string.ascii_lowercase + string.digits
         while True:
-            alias = ''.join(random.choice(chars) for x in range(4))
-            if alias not in aliases:
+            alias = ''.join(random.choices(ALIAS_CHARS, k=4))
+            if alias not in self.alias_index:
                 break
         return alias
 
-    def _get_aliases(self):
-        """Generates a list of all task aliases.
-
-        Returns:
-            aliases (list): the list of all task aliases.
-
-        """
-        aliases = []
-        for task in self.tasks:
-            alias = self.tasks[task].get('alias')
-            if alias:
-                aliases.append(alias.lower())
-        return aliases
-
     def _handle_error(self, msg):
         """Reports an error message and conditionally handles error exit
         or notification.
@@ -989,6 +1370,20 @@ class Tasks():
         else:
             self._error_exit(msg)
 
+    @staticmethod
+    def _has_notes(data):
+        """Check whether parsed task file data includes notes.
+
+        Args:
+            data (obj):     the parsed file data.
+
+        Returns:
+            (bool):     the task has notes.
+
+        """
+        task = data.get('task') if isinstance(data, dict) else None
+        return isinstance(task, dict) and bool(task.get('notes'))
+
     @staticmethod
     def _integer_or_default(inputdata, default=None):
         """Verify an input data and return an integer or a default
@@ -1003,56 +1398,166 @@ class Tasks():
             output (int): a verified integer, a default value, or None.
 
         """
-        try:
-            output = int(inputdata)
-        except (ValueError, TypeError):
+        if inputdata is None:
             output = default
+        elif type(inputdata) is int:
+            # already an integer (e.g., parsed from YAML)
+            output = inputdata
+        else:
+            try:
+                output = int(inputdata)
+            except (ValueError, TypeError):
+                output = default
         return output
 
+    @staticmethod
+    def _load_task_file(filename):
+        """Read and parse a task file.
+
+        Args:
+            filename (str): the task file to read.
+
+        Returns:
+            success (bool): whether or not the file could be read and
+        parsed.
+            data (dict):    the parsed file data.
+
+        """
+        try:
+            # the loader decodes the (utf-8) bytes itself
+            with open(filename, "rb") as task_file:
+                data = yaml.load(task_file, Loader=SafeLoader)
+        except (OSError, IOError, yaml.YAMLError):
+            return False, None
+        return True, data
+
+    def _make_format_labels(self):
+        """Build the styled labels and flags used by _format_task(), so
+        they are not recreated for every task.
+
+        """
+        self.format_labels = {}
+        for label in [
+                'location',
+                'project',
+                'tags',
+                'start',
+                'due',
+                'started',
+                'completed',
+                'parent',
+                'subtasks']:
+            labeltxt = Text(f"{label}: ")
+            labeltxt.stylize(self.style_label)
+            self.format_labels[label] = labeltxt
+        for flag, char in [('notes', '*'), ('recur', '@')]:
+            flagtxt = Text(char)
+            flagtxt.stylize(self.style_flag)
+            self.format_labels[flag] = flagtxt
+
+    def _make_indexes(self):
+        """Build the sorted start/due date index, the status, project
+        and tag indexes and the priority ranking used by the finders,
+        list builders and searches.
+
+        """
+        self.date_index = {}
+        self.status_index = {}
+        self.project_index = {}
+        self.tag_index = {}
+        self.priority_rank = {}
+        for rank, uid in enumerate(self._sort_tasks(self.tasks, 'priority')):
+            self.priority_rank[uid] = rank
+        for field in ['start', 'due']:
+            entries = []
+            for uid in self.tasks:
+                taskdate = self._parse_task(uid)[field]
+                if isinstance(taskdate, datetime):
+                    entries.append((taskdate, uid))
+            entries.sort(key=lambda x: x[0])
+            self.date_index[field] = (
+                [entry[0] for entry in entries],
+                [entry[1] for entry in entries])
+        for uid in self.tasks:
+            task = self._parse_task(uid)
+            self.status_index.setdefault(task['status'], set()).add(uid)
+            if task['project']:
+                self.project_index.setdefault(
+                    task['project'], set()).add(uid)
+            for tag in task['tags_set']:
+                self.tag_index.setdefault(tag, set()).add(uid)
+
     def _make_parents(self):
         self.parents = {}
-        for task in self.tasks:
-            parent = self.tasks[task].get('parent')
+        for task, entry in self.tasks.items():
+            parent = entry.get('parent')
             if parent:
                 # get the uid matching the parent's alias
-                uid = None
-                for this_task in self.tasks:
-                    alias = self.tasks[this_task].get('alias')
-                    if alias == parent:
-                        uid = this_task
+                uid = self.alias_index.get(str(parent).lower())
                 if uid:
-                    if uid in self.parents.keys():
-                        self.parents[uid].append(task)
-                    else:
-                        children = [task]
-                        self.parents[uid] = children
+                    self.parents.setdefault(uid, []).append(task)
 
     def _make_project_style(self, project):
         """Create a style for a project label based on values in
-        self.project_colors.
+        self.project_colors. Styles are created once per project and
+        reused.
 
         Args:
-            project (str): the project name to stylize.\
+            project (str): the project name to stylize.
 
         Returns:
             this_style (obj): Rich Style() object.
 
         """
-        color = self.project_colors.get(project)
-        if color and self.color_enabled:
-            try:
-                this_style = Style(color=color)
-            except ColorParseError:
+        this_style = self.project_styles.get(project)
+        if not this_style:
+            color = None
+            if self.project_colors:
+                color = self.project_colors.get(project)
+            if color and self.color_enabled:
+                try:
+                    this_style = Style(color=color)
+                except ColorParseError:
+                    this_style = Style(color="default")
+            else:
                 this_style = Style(color="default")
-        else:
-            this_style = Style(color="default")
+            self.project_styles[project] = this_style
 
         return this_style
 
+    @staticmethod
+    def _make_reminders(reminders):
+        """Build reminder entries from (remind[, notify]) sequences.
+        Empty sequences are skipped and any notify type other than
+        'display' or 'email' becomes 'display'.
+
+        Args:
+            reminders (list):   the reminder sequences.
+
+        Returns:
+            entries (list): the reminder dicts.
+
+        """
+        entries = []
+        for entry in reminders:
+            if not entry:
+                continue
+            rem_data = {'remind': entry[0]}
+            if len(entry) == 2:
+                remtype = str(entry[1]).lower()
+                if remtype not in NOTIFY_TYPES:
+                    remtype = 'display'
+                rem_data['notify'] = remtype
+            entries.append(rem_data)
+        return entries
+
     def _parse_config(self):
         """Read and parse the configuration file."""
-        config = configparser.ConfigParser()
+        # values are plain strings, so skip the '%' interpolation pass
+        # on every lookup
+        config = configparser.ConfigParser(interpolation=None)
         if os.path.isfile(self.config_file):
+            self.config_signature = self._config_signature()
             try:
                 config.read(self.config_file)
             except configparser.Error:
@@ -1060,9 +1565,8 @@ class Tasks():
 
             if "main" in config:
                 if config["main"].get("data_dir"):
-                    self.data_dir = os.path.expandvars(
-                        os.path.expanduser(
-                            config["main"].get("data_dir")))
+                    self.data_dir = expand_path(
+                        config["main"].get("data_dir"))
                 # warning days for upcoming tasks
                 self.days_soon = config["main"].get(
                     "days_soon", 1)
@@ -1127,159 +1631,14 @@ class Tasks():
                     )
                     self.priority_normal = 9
 
-            def _apply_colors():
-                """Try to apply custom colors and catch exceptions for
-                invalid color names.
-                """
-                try:
-                    self.style_title = Style(
-                        color=self.color_title,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_description = Style(
-                        color=self.color_description)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_location = Style(
-                        color=self.color_location)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_alias = Style(
-                        color=self.color_alias)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_tags = Style(
-                        color=self.color_tags)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_parent = Style(
-                        color=self.color_parent)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_label = Style(
-                        color=self.color_label)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_date = Style(
-                        color=self.color_date)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_date_soon = Style(
-                        color=self.color_date_soon,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_date_late = Style(
-                        color=self.color_date_late,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_done = Style(
-                        color=self.color_status_done,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_todo = Style(
-                        color=self.color_status_todo,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_inprogress = Style(
-                        color=self.color_status_inprogress,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_waiting = Style(
-                        color=self.color_status_waiting,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_onhold = Style(
-                        color=self.color_status_onhold,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_blocked = Style(
-                        color=self.color_status_blocked,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_cancelled = Style(
-                        color=self.color_status_cancelled,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_status_default = Style(
-                        color="default",
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_priority_low = Style(
-                        color=self.color_priority_low)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_priority_normal = Style(
-                        color=self.color_priority_normal)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_priority_medium = Style(
-                        color=self.color_priority_medium)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_priority_high = Style(
-                        color=self.color_priority_high)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_percent = Style(
-                        color=self.color_percent)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_percent_100 = Style(
-                        color=self.color_percent_100,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_flag = Style(
-                        color=self.color_flag,
-                        bold=self.color_bold)
-                except ColorParseError:
-                    pass
-                try:
-                    self.style_date_done = Style(
-                        color=self.color_date,
-                        bold=False)
-                except ColorParseError:
-                    pass
-
-            # apply default colors
-            _apply_colors()
-
             if "colors" in config:
+                # fall back to the current colors for any custom color
+                # that is invalid
+                fallback = {}
+                for _, color_attr, _ in STYLE_COLORS:
+                    if color_attr:
+                        fallback[color_attr] = getattr(self, color_attr)
+
                 # custom colors
                 self.color_title = (
                     config["colors"].get(
@@ -1361,354 +1720,265 @@ class Tasks():
                 # disable colors
                 if bool(config["colors"].getboolean("disable_colors")):
                     self.color_enabled = False
-                    self.color_title = "default"
-                    self.color_description = "default"
-                    self.color_location = "default"
-                    self.color_alias = "default"
-                    self.color_tags = "default"
-                    self.color_parent = "default"
-                    self.color_label = "default"
-                    self.color_date = "default"
-                    self.color_date_soon = "default"
-                    self.color_date_late = "default"
-                    self.color_status_done = "default"
-                    self.color_status_todo = "default"
-                    self.color_status_inprogress = "default"
-                    self.color_status_waiting = "default"
-                    self.color_status_onhold = "default"
-                    self.color_status_blocked = "default"
-                    self.color_status_cancelled = "default"
-                    self.color_priority_low = "default"
-                    self.color_priority_normal = "default"
-                    self.color_priority_medium = "default"
-                    self.color_priority_high = "default"
-                    self.color_percent = "default"
-                    self.color_percent_100 = "default"
-                    self.color_flag = "default"
+                    for _, color_attr, _ in STYLE_COLORS:
+                        if color_attr:
+                            setattr(self, color_attr, "default")
 
                 # disable bold
                 if bool(config["colors"].getboolean("disable_bold")):
                     self.color_bold = False
 
                 # try to apply requested custom colors
-                _apply_colors()
+                self._apply_colors(fallback)
+            else:
+                # apply default colors
+                self._apply_colors()
 
             if "project_colors" in config:
                 project_colors = config["project_colors"]
                 self.project_colors = {}
                 for proj in project_colors:
                     self.project_colors[proj] = project_colors.get(proj)
+                self.project_styles = {}
         else:
             self._error_exit("Config file not found")
 
+        self._make_format_labels()
+
     def _parse_files(self):
         """ Read task files from `data_dir` and parse task data into
         `tasks`.
 
-        Returns:
-            tasks (dict):    parsed data from each task file
-
-        """
-        this_task_files = {}
-        this_tasks = {}
-        aliases = {}
-
-        with os.scandir(self.data_dir) as entries:
-            for entry in entries:
-                if entry.name.endswith('.yml') and entry.is_file():
-                    fullpath = entry.path
-                    data = None
-                    try:
-                        with open(fullpath, "r",
-                                  encoding="utf-8") as entry_file:
-                            data = yaml.safe_load(entry_file)
-                    except (OSError, IOError, yaml.YAMLError):
-                        self._error_pass(
-                            f"failure reading or parsing {fullpath} "
-                            "- SKIPPING")
-                    if data:
-                        uid = None
-                        task = data.get("task")
-                        if task:
-                            uid = task.get("uid")
-                            alias = task.get("alias")
-                            add_task = True
-                            if uid:
-                                # duplicate UID detection
-                                dupid = this_task_files.get(uid)
-                                if dupid:
-                                    self._error_pass(
-                                        "duplicate UID detected:\n"
-                                        f"  {uid}\n"
-                                        f"  {dupid}\n"
-                                        f"  {fullpath}\n"
-                                        f"SKIPPING {fullpath}")
-                                    add_task = False
-                            if alias:
-                                # duplicate alias detection
-                                dupalias = aliases.get(alias)
-                                if dupalias:
-                                    self._error_pass(
-                                        "duplicate alias detected:\n"
-                                        f"  {alias}\n"
-                                        f"  {dupalias}\n"
-                                        f"  {fullpath}\n"
-                                        f"SKIPPING {fullpath}")
-                                    add_task = False
-                            if add_task:
-                                if alias and uid:
-                                    this_tasks[uid] = task
-                                    this_task_files[uid] = fullpath
-                                    aliases[alias] = fullpath
-                                else:
-                                    self._error_pass(
-                                        "no uid and/or alias param "
-                                        f"in {fullpath} - SKIPPING")
-                        else:
-                            self._error_pass(
-                                f"no data in {fullpath} - SKIPPING")
-        self.tasks = this_tasks.copy()
-        self.task_files = this_task_files.copy()
-        self._make_parents()
-
-    def _parse_rrule(self, expression):
-        """Parses a recurring rule expression and returns a dict of
-        recurrence parameters.
-
-        Args:
-            expression (str):   the rrule expression.
-
-        Returns:
-            rrule (dict):       the recurrence parameters (or None)
-
-        """
-        expression = expression.lower()
-        valid_criteria = [
-                "date=",        # specific recurrence dates
-                "except=",      # specific exception dates
-                "freq=",        # frequency (minutely, hourly, daily,
-                                #   weekly, monthly, yearly)
-                "count=",       # number of recurrences
-                "until=",       # recur until date
-                "interval=",    # interval of recurrence
-                "byhour=",      # recur by hour (0-23)
-                "byweekday=",   # SU, MO, TU, WE, TH, FR, SA
-                "bymonth=",     # recur by month (1-12)
-                "bymonthday=",  # day of month (1-31)
-                "byyearday=",   # day of the year (1-366)
-                "byweekno=",    # week of year (1-53)
-                "bysetpos=",    # set position of occurence set (e.g.,
-                                # 1 for first, -1 for last, -2 for
-                                # second to last
-        ]
-        if not any(x in expression for x in valid_criteria):
-            rrule = None
-        else:
-            try:
-                rrule = dict((k.strip(), v.strip())
-                             for k, v in (item.split('=')
-                             for item in expression.split(';')))
-            except ValueError:
-                rrule = None
-
-        if rrule.get('date'):
-            date_strings = rrule['date'].split(',')
-            rr_date = []
-            for entry in date_strings:
-                this_date = self._datetime_or_none(entry)
-                if this_date:
-                    rr_date.append(this_date)
-            rrule['date'] = sorted(rr_date)
-
-        if rrule.get('except'):
-            except_strings = rrule['except'].split(',')
-            rr_except = []
-            for entry in except_strings:
-                this_except = self._datetime_or_none(entry)
-                if this_except:
-                    rr_except.append(this_except)
-            rrule['except'] = sorted(rr_except)
-
-        if rrule.get('freq'):
-            rr_freq = rrule['freq'].upper()
-            if rr_freq in ['MINUTELY', 'HOURLY', 'DAILY',
-                           'WEEKLY', 'MONTHLY', 'YEARLY']:
-                rrule['freq'] = rr_freq
-            else:
-                rrule['freq'] = None
-
-        if rrule.get('count'):
-            rrule['count'] = self._integer_or_default(rrule['count'])
-
-        if rrule.get('until'):
-            rrule['until'] = self._datetime_or_none(rrule['until'])
-
-        if rrule.get('interval'):
-            rrule['interval'] = self._integer_or_default(rrule['interval'])
-
-        if rrule.get('byhour'):
-            rr_byhour = self._integer_or_default(rrule['byhour'])
-            if rr_byhour:
-                if 0 <= rr_byhour <= 23:
-                    rrule['byhour'] = rr_byhour
-                else:
-                    rrule['byhour'] = None
-            else:
-                rrule['byhour'] = None
-
-        if rrule.get('byweekday'):
-            rr_byweekday = rrule['byweekday'].upper()
-            if rr_byweekday in ['SU', 'MO', 'TU', 'WE',
-                                'TH', 'FR', 'SA']:
-                rrule['byweekday'] = rr_byweekday
-            else:
-                rrule['byweekday'] = None
-
-        if rrule.get('bymonth'):
-            rr_bymonth = self._integer_or_default(rrule['bymonth'])
-            if rr_bymonth:
-                if 1 <= rr_bymonth <= 12:
-                    rrule['bymonth'] = rr_bymonth
-                else:
-                    rrule['bymonth'] = None
-            else:
-                rrule['bymonth'] = None
-
-        if rrule.get('bymonthday'):
-            rr_bymonthday = self._integer_or_default(rrule['bymonthday'])
-            if rr_bymonthday:
-                if 1 <= rr_bymonthday <= 31:
-                    rrule['bymonthday'] = rr_bymonthday
-                else:
-                    rrule['bymonthday'] = None
-            else:
-                rrule['bymonthday'] = None
-
-        if rrule.get('byyearday'):
-            rr_byyearday = self._integer_or_default(rrule['byyearday'])
-            if rr_byyearday:
-                if 1 <= rr_byyearday <= 366:
-                    rrule['byyearday'] = rr_byyearday
-                else:
-                    rrule['byyearday'] = None
-            else:
-                rrule['byyearday'] = None
-
-        if rrule.get('byweekno'):
-            rr_byweekno = self._integer_or_default(rrule['byweekno'])
-            if rr_byweekno:
-                if 1 <= rr_byweekno <= 53:
-                    rrule['byweekno'] = rr_byweekno
-                else:
-                    rrule['byweekno'] = None
-            else:
-                rrule['byweekno'] = None
-
-        if rrule.get('bysetpos'):
-            rrule['bysetpos'] = self._integer_or_default(rrule['bysetpos'])
-
-        return rrule
-
-    def _parse_task(self, uid):
-        """Parse a task and return values for task parameters.
-
-        Args:
-            uid (str): the UUID of the task to parse.
-
-        Returns:
-            task (dict):    the task parameters.
-
-        """
-        task = {}
-        task['uid'] = self.tasks[uid].get('uid')
-
-        task['created'] = self.tasks[uid].get('created')
-        if task['created']:
-            task['created'] = self._datetime_or_none(task['created'])
-
-        task['updated'] = self.tasks[uid].get('updated')
-        if task['updated']:
-            task['updated'] = self._datetime_or_none(task['updated'])
-
-        task['alias'] = self.tasks[uid].get('alias')
-        if task['alias']:
-            task['alias'] = task['alias'].lower()
-
-        task['description'] = self.tasks[uid].get('description')
-        task['location'] = self.tasks[uid].get('location')
-
-        task['project'] = self.tasks[uid].get('project')
-        if task['project']:
-            task['project'] = task['project'].lower()
-
-        task['rrule'] = self.tasks[uid].get('rrule')
-
-        task['priority'] = self.tasks[uid].get('priority')
-        if task['priority']:
-            task['priority'] = self._integer_or_default(task['priority'])
-
-        task['tags'] = self.tasks[uid].get('tags')
-
-        task['start'] = self.tasks[uid].get('start')
-        if task['start']:
-            task['start'] = self._datetime_or_none(task['start'])
-
-        task['due'] = self.tasks[uid].get('due')
-        if task['due']:
-            task['due'] = self._datetime_or_none(task['due'])
-
-        task['started'] = self.tasks[uid].get('started')
-        if task['started']:
-            task['started'] = self._datetime_or_none(task['started'])
+        Returns:
+            tasks (dict):    parsed data from each task file
 
-        task['completed'] = self.tasks[uid].get('completed')
-        if task['completed']:
-            task['completed'] = self._datetime_or_none(task['completed'])
+        """
+        this_task_files = {}
+        this_tasks = {}
+        this_alias_index = {}
+        aliases = {}
+        file_cache = self._read_file_cache()
+        new_file_cache = {}
+        cache_changed = False
 
-        task['percent'] = self.tasks[uid].get('percent')
-        if task['percent']:
-            task['percent'] = self._integer_or_default(task['percent'])
+        # find the task files and their (mtime, ctime, size) signatures
+        task_files = []
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.yml') and entry.is_file():
+                    try:
+                        stat = entry.stat()
+                        signature = (
+                            stat.st_mtime_ns,
+                            stat.st_ctime_ns,
+                            stat.st_size)
+                    except OSError:
+                        signature = None
+                    task_files.append((entry.path, signature))
+
+        # read any files that are not cached (or have changed) in
+        # parallel, keeping the results in directory order
+        uncached = []
+        for fullpath, signature in task_files:
+            cached = file_cache.get(fullpath)
+            if not (signature and cached and cached[0] == signature):
+                uncached.append(fullpath)
+        if len(uncached) > 1:
+            with ThreadPoolExecutor() as executor:
+                loaded = dict(zip(
+                    uncached, executor.map(self._load_task_file, uncached)))
+        else:
+            loaded = {fullpath: self._load_task_file(fullpath)
+                      for fullpath in uncached}
+
+        for fullpath, signature in task_files:
+            data = None
+            if fullpath in loaded:
+                success, data = loaded[fullpath]
+                if not success:
+                    self._error_pass(
+                        f"failure reading or parsing {fullpath} "
+                        "- SKIPPING")
+                elif signature and not self._has_notes(data):
+                    # notes are not kept in the cache, so files with
+                    # notes are always read from data_dir
+                    new_file_cache[fullpath] = (signature, data)
+                    cache_changed = True
+            else:
+                new_file_cache[fullpath] = file_cache[fullpath]
+                data = file_cache[fullpath][1]
+            if data:
+                uid = None
+                task = data.get("task")
+                if task:
+                    uid = task.get("uid")
+                    alias = task.get("alias")
+                    add_task = True
+                    if uid:
+                        # duplicate UID detection
+                        dupid = this_task_files.get(uid)
+                        if dupid:
+                            self._error_pass(
+                                "duplicate UID detected:\n"
+                                f"  {uid}\n"
+                                f"  {dupid}\n"
+                                f"  {fullpath}\n"
+                                f"SKIPPING {fullpath}")
+                            add_task = False
+                    if alias:
+                        # duplicate alias detection
+                        dupalias = aliases.get(alias)
+                        if dupalias:
+                            self._error_pass(
+                                "duplicate alias detected:\n"
+                                f"  {alias}\n"
+                                f"  {dupalias}\n"
+                                f"  {fullpath}\n"
+                                f"SKIPPING {fullpath}")
+                            add_task = False
+                    if add_task:
+                        if alias and uid:
+                            this_tasks[uid] = task
+                            this_task_files[uid] = fullpath
+                            this_alias_index[str(alias).lower()] = uid
+                            aliases[alias] = fullpath
+                        else:
+                            self._error_pass(
+                                "no uid and/or alias param "
+                                f"in {fullpath} - SKIPPING")
+                else:
+                    self._error_pass(
+                        f"no data in {fullpath} - SKIPPING")
+        # new or changed files set cache_changed, removed or broken
+        # files shrink the cache
+        if cache_changed or len(new_file_cache) != len(file_cache):
+            self._write_file_cache(new_file_cache)
+        self.tasks = this_tasks
+        self.task_files = this_task_files
+        self.alias_index = this_alias_index
+        self.task_cache = {}
+        self.rrule_cache = {}
+        self.datetime_cache = {}
+        self.timestamp_cache = {}
+        self._reset_indexes()
+        self._make_parents()
 
-        task['status'] = self.tasks[uid].get('status')
-        if task['status']:
-            task['status'] = task['status'].lower()
+    def _parse_rrule(self, expression):
+        """Parses a recurring rule expression and returns a dict of
+        recurrence parameters.
 
-        task['parent'] = self.tasks[uid].get('parent')
-        if task['parent']:
-            task['parent'] = task['parent'].lower()
+        Args:
+            expression (str):   the rrule expression.
 
-        task['reminders'] = self.tasks[uid].get('reminders')
+        Returns:
+            rrule (dict):       the recurrence parameters (or None)
 
-        task['notes'] = self.tasks[uid].get('notes')
+        """
+        rrule = {}
+        for key, value in RRULE_REGEX.findall(expression.lower()):
+            if key in RRULE_CRITERIA:
+                rrule[key] = value.strip()
+        if not rrule:
+            return None
+
+        for key, value in rrule.items():
+            if not value:
+                continue
+            if key in ('date', 'except'):
+                dates = set()
+                for entry in value.split(','):
+                    this_date = self._datetime_or_none(entry)
+                    if this_date:
+                        dates.add(this_date)
+                rrule[key] = sorted(dates)
+            elif key == 'until':
+                rrule[key] = self._datetime_or_none(value)
+            elif key == 'freq':
+                value = value.upper()
+                rrule[key] = value if value in RRULE_FREQUENCIES else None
+            elif key == 'byweekday':
+                value = value.upper()
+                rrule[key] = value if value in RRULE_WEEKDAYS else None
+            elif key in RRULE_INTEGER_RANGES:
+                number = self._integer_or_default(value)
+                limits = RRULE_INTEGER_RANGES[key]
+                if (number is not None and limits and
+                        not limits[0] <= number <= limits[1]):
+                    number = None
+                rrule[key] = number
 
-        return task
+        return rrule
 
-    @staticmethod
-    def _pass_filter(condition, status):
-        """Check a provided status against a predefined condition and
-        return True or False if the status passes the filter.
+    def _parse_task(self, uid):
+        """Parse a task and return values for task parameters. Parsed
+        tasks are cached in `task_cache` until the task files are next
+        read, so callers must not modify the returned dict.
 
         Args:
-            condition (str):    the condition profile.
-            status (str):       the task status to check.
+            uid (str): the UUID of the task to parse.
 
         Returns:
-            passes (bool):       whether or not the status passes the
-        filter.
+            task (dict):    the task parameters.
 
         """
-        if not status:
-            # no status, can't meet any condition
-            passes = False
-        elif condition == 'done':
-            passes = status.lower() == 'done'
-        elif condition == 'open':
-            passes = status.lower() not in ['done', 'cancelled']
+        task = self.task_cache.get(uid)
+        if task:
+            return task
+
+        entry = self.tasks[uid]
+        task = {}
+        for field in [
+                'uid',
+                'description',
+                'location',
+                'rrule',
+                'tags',
+                'reminders',
+                'notes']:
+            task[field] = entry.get(field)
+        for field in [
+                'created',
+                'updated',
+                'start',
+                'due',
+                'started',
+                'completed']:
+            value = entry.get(field)
+            if value:
+                value = self._datetime_or_none(value)
+            task[field] = value
+        # epoch timestamps of the searchable dates for range checks
+        for field in ['start', 'due', 'started', 'completed']:
+            value = task[field]
+            task[f'{field}_ts'] = value.timestamp() if value else None
+        for field in ['alias', 'project', 'status', 'parent']:
+            value = entry.get(field)
+            if value:
+                value = value.lower()
+            task[field] = value
+        for field in ['priority', 'percent']:
+            value = entry.get(field)
+            if value:
+                value = self._integer_or_default(value)
+            task[field] = value
+        # lower-cased copies of the free text fields for searching
+        for field in ['description', 'location', 'notes']:
+            value = task[field]
+            if value:
+                value = str(value).lower()
+            task[f'{field}_lower'] = value
+        # the tags as a set for searching
+        tags = task['tags']
+        if isinstance(tags, list):
+            task['tags_set'] = frozenset(
+                tag for tag in tags if isinstance(tag, str))
+        elif isinstance(tags, str):
+            task['tags_set'] = frozenset([tags])
         else:
-            # no filter / not a valid filter, everything passes
-            passes = True
+            task['tags_set'] = frozenset()
 
-        return passes
+        self.task_cache[uid] = task
+        return task
 
     def _perform_search(self, term):
         """Parses a search term and returns a list of matching tasks.
@@ -1733,14 +2003,14 @@ class Tasks():
         # helper lambda functions for parsing search and exclude strings
         def _parse_dt_range(timestr):
             """Parses a datetime range expression and returns start and
-            end datetime objects.
+            end epoch timestamps.
 
             Args:
                 timestr (str):  the datetime range string provided.
 
             Returns:
-                begin (obj):    a valid datetime object.
-                end (obj):      a valid datetime object.
+                begin (float):  the epoch timestamp of the range start.
+                end (float):    the epoch timestamp of the range end.
 
             """
             now = datetime.now(tz=self.ltz)
@@ -1760,8 +2030,7 @@ class Tasks():
                 end = self._datetime_or_none(
                             times[1].strip())
             else:
-                begin = self._datetime_or_none(timestr)
-                end = self._datetime_or_none(timestr)
+                begin = end = self._datetime_or_none(timestr)
             # return a valid range, regardless
             # if the input values were bad, we'll just ignore them and
             # match all timestamps 1969-01-01 to present.
@@ -1774,7 +2043,7 @@ class Tasks():
             # time in that day.
             elif end.hour == 0 and end.minute == 0:
                 end = end.replace(hour=23, minute=59, second=59)
-            return begin, end
+            return begin.timestamp(), end.timestamp()
 
         def _parse_pri_range(prioritystr):
             """Parses a priority range expression and returns start and
@@ -1848,6 +2117,19 @@ class Tasks():
                 end = 100
             return begin, end
 
+        def _in_range(value, bounds):
+            """Checks whether a value falls within a (begin, end) range.
+
+            Args:
+                value (obj):    the value to check.
+                bounds (tuple): the begin and end values.
+
+            Returns:
+                within (bool):  the value is within the range.
+
+            """
+            return bounds[0] <= value <= bounds[1]
+
         # if the exclusion operator is in the provided search term then
         # split the term into two components: search and exclude
         # otherwise, treat it as just a search term alone.
@@ -1859,72 +2141,55 @@ class Tasks():
             searchterm = str(term).lower()
             excludeterm = None
 
-        valid_criteria = [
-            "uid=",
-            "description=",
-            "location=",
-            "project=",
-            "alias=",
-            "tags=",
-            "status=",
-            "parent=",
-            "priority=",
-            "percent=",
-            "start=",
-            "due=",
-            "started=",
-            "completed=",
-            "notes="
-        ]
         # parse the search term into a dict
         if searchterm:
             if searchterm == 'any':
                 search = None
-            elif not any(x in searchterm for x in valid_criteria):
+            elif not SEARCH_CRITERIA_REGEX.search(searchterm):
                 # treat this as a simple description search
                 search = {}
                 search['description'] = searchterm.strip()
+            elif SEARCH_TERM_REGEX.fullmatch(searchterm):
+                search = dict(
+                    (k.strip(), v.strip())
+                    for k, v in SEARCH_PAIR_REGEX.findall(searchterm))
             else:
-                try:
-                    search = dict((k.strip(), v.strip())
-                                  for k, v in (item.split('=')
-                                  for item in searchterm.split(',')))
-                except ValueError:
-                    msg = "invalid search expression"
-                    if not self.interactive:
-                        self._error_exit(msg)
-                    else:
-                        self._error_pass(msg)
-                        return
+                msg = "invalid search expression"
+                if not self.interactive:
+                    self._error_exit(msg)
+                else:
+                    self._error_pass(msg)
+                    return
         else:
             search = None
 
         # parse the exclude term into a dict
         if excludeterm:
-            if not any(x in excludeterm for x in valid_criteria):
+            if not SEARCH_CRITERIA_REGEX.search(excludeterm):
                 # treat this as a simple description search
                 exclude = {}
                 exclude['description'] = excludeterm.strip()
+            elif SEARCH_TERM_REGEX.fullmatch(excludeterm):
+                exclude = dict(
+                    (k.strip(), v.strip())
+                    for k, v in SEARCH_PAIR_REGEX.findall(excludeterm))
             else:
-                try:
-                    exclude = dict((k.strip(), v.strip())
-                                   for k, v in (item.split('=')
-                                   for item in excludeterm.split(',')))
-                except ValueError:
-                    msg = "invalid exclude expression"
-                    if not self.interactive:
-                        self._error_exit(msg)
-                    else:
-                        self._error_pass(msg)
-                        return
+                msg = "invalid exclude expression"
+                if not self.interactive:
+                    self._error_exit(msg)
+                else:
+                    self._error_pass(msg)
+                    return
         else:
             exclude = None
 
-        this_tasks = {}
-        for uid in self.tasks:
-            this_tasks[uid] = []
-        exclude_list = []
-
+        # build the exclude checks (any match excludes a task) and the
+        # search checks (every check must pass) once, so each task only
+        # runs checks until the outcome is decided. Range expressions are
+        # parsed here rather than per task, and checks are ordered
+        # cheapest first: equality tests, then range comparisons, then
+        # substring tests.
+        exclude_checks = []
         if exclude:
             x_uid = exclude.get('uid')
             x_alias = exclude.get('alias')
@@ -1933,10 +2198,10 @@ class Tasks():
             x_project = exclude.get('project')
             x_tags = exclude.get('tags')
             if x_tags:
-                x_tags = x_tags.split('+')
+                x_tags = frozenset(x_tags.split('+'))
             x_status = exclude.get('status')
             if x_status:
-                x_status = x_status.split('+')
+                x_status = frozenset(x_status.split('+'))
             x_parent = exclude.get('parent')
             x_priority = exclude.get('priority')
             x_percent = exclude.get('percent')
@@ -1946,86 +2211,73 @@ class Tasks():
             x_completed = exclude.get('completed')
             x_notes = exclude.get('notes')
 
-            for uid in this_tasks:
-                task = self._parse_task(uid)
-                remove = False
-                if x_uid:
-                    if x_uid == uid:
-                        remove = True
-                if x_alias:
-                    if task['alias']:
-                        if x_alias == task['alias']:
-                            remove = True
-                if x_description:
-                    if task['description']:
-                        if x_description in task['description']:
-                            remove = True
-                if x_location:
-                    if task['location']:
-                        if x_location in task['location']:
-                            remove = True
-                if x_project:
-                    if task['project']:
-                        if x_project in task['project']:
-                            remove = True
-                if x_tags:
-                    if task['tags']:
-                        for tag in x_tags:
-                            if tag in task['tags']:
-                                remove = True
-                if x_status:
-                    if task['status']:
-                        for this_status in x_status:
-                            if this_status == task['status']:
-                                remove = True
-                if x_parent:
-                    if task['parent']:
-                        if x_parent == task['parent']:
-                            remove = True
-                if x_priority:
-                    if task['priority']:
-                        begin, end = _parse_pri_range(x_priority)
-                        if begin <= task['priority'] <= end:
-                            remove = True
-                if x_percent:
-                    if task['percent']:
-                        begin, end = _parse_perc_range(x_percent)
-                        if begin <= task['percent'] <= end:
-                            remove = True
-                if x_start:
-                    if task['start']:
-                        begin, end = _parse_dt_range(x_start)
-                        if begin <= task['start'] <= end:
-                            remove = True
-                if x_due:
-                    if task['due']:
-                        begin, end = _parse_dt_range(x_due)
-                        if begin <= task['due'] <= end:
-                            remove = True
-                if x_started:
-                    if task['started']:
-                        begin, end = _parse_dt_range(x_started)
-                        if begin <= task['started'] <= end:
-                            remove = True
-                if x_completed:
-                    if task['completed']:
-                        begin, end = _parse_dt_range(x_completed)
-                        if begin <= task['completed'] <= end:
-                            remove = True
-                if x_notes:
-                    if task['notes']:
-                        if x_notes in task['notes']:
-                            remove = True
-
-                if remove:
-                    exclude_list.append(uid)
-
-        # remove excluded tasks
-        for uid in exclude_list:
-            this_tasks.pop(uid)
-
-        not_match = []
-
+            if x_uid:
+                exclude_checks.append(
+                    lambda uid, task: x_uid == uid)
+            if x_alias:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['alias']) and
+                    x_alias == task['alias'])
+            if x_parent:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['parent']) and
+                    x_parent == task['parent'])
+            if x_status:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['status']) and
+                    task['status'] in x_status)
+            if x_priority:
+                x_priority_range = _parse_pri_range(x_priority)
+                exclude_checks.append(
+                    lambda uid, task: bool(task['priority']) and
+                    _in_range(task['priority'], x_priority_range))
+            if x_percent:
+                x_percent_range = _parse_perc_range(x_percent)
+                exclude_checks.append(
+                    lambda uid, task: bool(task['percent']) and
+                    _in_range(task['percent'], x_percent_range))
+            if x_start:
+                x_start_range = _parse_dt_range(x_start)
+                exclude_checks.append(
+                    lambda uid, task: task['start_ts'] is not None and
+                    _in_range(task['start_ts'], x_start_range))
+            if x_due:
+                x_due_range = _parse_dt_range(x_due)
+                exclude_checks.append(
+                    lambda uid, task: task['due_ts'] is not None and
+                    _in_range(task['due_ts'], x_due_range))
+            if x_started:
+                x_started_range = _parse_dt_range(x_started)
+                exclude_checks.append(
+                    lambda uid, task: task['started_ts'] is not None and
+                    _in_range(task['started_ts'], x_started_range))
+            if x_completed:
+                x_completed_range = _parse_dt_range(x_completed)
+                exclude_checks.append(
+                    lambda uid, task: task['completed_ts'] is not None and
+                    _in_range(task['completed_ts'], x_completed_range))
+            if x_project:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['project']) and
+                    x_project in task['project'])
+            if x_tags:
+                exclude_checks.append(
+                    lambda uid, task:
+                    not task['tags_set'].isdisjoint(x_tags))
+            if x_description:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['description']) and
+                    x_description in task['description'])
+            if x_location:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['location']) and
+                    x_location in task['location'])
+            if x_notes:
+                exclude_checks.append(
+                    lambda uid, task: bool(task['notes']) and
+                    x_notes in task['notes'])
+
+        search_checks = []
         if search:
             s_uid = search.get('uid')
             s_alias = search.get('alias')
@@ -2034,10 +2286,10 @@ class Tasks():
             s_project = search.get('project')
             s_tags = search.get('tags')
             if s_tags:
-                s_tags = s_tags.split('+')
+                s_tags = frozenset(s_tags.split('+'))
             s_status = search.get('status')
             if s_status:
-                s_status = s_status.split('+')
+                s_status = frozenset(s_status.split('+'))
             s_parent = search.get('parent')
             s_priority = search.get('priority')
             s_percent = search.get('percent')
@@ -2049,123 +2301,112 @@ class Tasks():
             if s_notes:
                 s_notes = s_notes.lower()
 
-            for uid in this_tasks:
-                task = self._parse_task(uid)
-                remove = False
-                if s_uid:
-                    if not s_uid == uid:
-                        remove = True
-                if s_alias:
-                    if task['alias']:
-                        if not s_alias == task['alias']:
-                            remove = True
-                    else:
-                        remove = True
-                if s_description:
-                    if task['description']:
-                        if (s_description not in
-                                task['description'].lower()):
-                            remove = True
-                    else:
-                        remove = True
-                if s_location:
-                    if task['location']:
-                        if (s_location not in
-                                task['location'].lower()):
-                            remove = True
-                    else:
-                        remove = True
-                if s_project:
-                    if task['project']:
-                        if (s_project not in
-                                task['project'].lower()):
-                            remove = True
-                    else:
-                        remove = True
+            if s_uid:
+                search_checks.append(
+                    lambda uid, task: s_uid == uid)
+            if s_alias:
+                search_checks.append(
+                    lambda uid, task: bool(task['alias']) and
+                    s_alias == task['alias'])
+            if s_parent:
+                search_checks.append(
+                    lambda uid, task: bool(task['parent']) and
+                    s_parent == task['parent'])
+            if s_status:
+                # status also allows the '+' OR operator
+                search_checks.append(
+                    lambda uid, task: bool(task['status']) and
+                    task['status'] in s_status)
+            if s_priority:
+                s_priority_range = _parse_pri_range(s_priority)
+                search_checks.append(
+                    lambda uid, task: bool(task['priority']) and
+                    _in_range(task['priority'], s_priority_range))
+            if s_percent:
+                s_percent_range = _parse_perc_range(s_percent)
+                search_checks.append(
+                    lambda uid, task: bool(task['percent']) and
+                    _in_range(task['percent'], s_percent_range))
+            if s_start:
+                s_start_range = _parse_dt_range(s_start)
+                search_checks.append(
+                    lambda uid, task: task['start_ts'] is not None and
+                    _in_range(task['start_ts'], s_start_range))
+            if s_due:
+                s_due_range = _parse_dt_range(s_due)
+                search_checks.append(
+                    lambda uid, task: task['due_ts'] is not None and
+                    _in_range(task['due_ts'], s_due_range))
+            if s_started:
+                s_started_range = _parse_dt_range(s_started)
+                search_checks.append(
+                    lambda uid, task: task['started_ts'] is not None and
+                    _in_range(task['started_ts'], s_started_range))
+            if s_completed:
+                s_completed_range = _parse_dt_range(s_completed)
+                search_checks.append(
+                    lambda uid, task: task['completed_ts'] is not None and
+                    _in_range(task['completed_ts'], s_completed_range))
+            if s_project:
+                # project is already lower-cased by _parse_task()
+                search_checks.append(
+                    lambda uid, task: bool(task['project']) and
+                    s_project in task['project'])
+            if s_tags:
+                # searching for tags allows use of the '+' OR operator,
+                # so if we match any tag in the list then keep the entry
+                search_checks.append(
+                    lambda uid, task:
+                    not task['tags_set'].isdisjoint(s_tags))
+            if s_description:
+                search_checks.append(
+                    lambda uid, task: bool(task['description']) and
+                    s_description in task['description_lower'])
+            if s_location:
+                search_checks.append(
+                    lambda uid, task: bool(task['location']) and
+                    s_location in task['location_lower'])
+            if s_notes:
+                search_checks.append(
+                    lambda uid, task: bool(task['notes']) and
+                    s_notes in task['notes_lower'])
+
+        # a uid or alias search can match at most one task, so only
+        # that task needs to be checked. otherwise, tag and status
+        # searches only need to check the tasks in those indexes.
+        candidates = self.tasks
+        if search_checks:
+            if s_uid:
+                candidates = [s_uid] if s_uid in self.tasks else []
+            elif s_alias:
+                uid = self.alias_index.get(s_alias)
+                candidates = [uid] if uid else []
+            elif s_tags or s_status:
+                matched = None
                 if s_tags:
-                    keep = False
-                    if task['tags']:
-                        # searching for tags allows use of the '+' OR
-                        # operator, so if we match any tag in the list
-                        # then keep the entry
-                        for tag in s_tags:
-                            if tag in task['tags']:
-                                keep = True
-                    if not keep:
-                        remove = True
+                    matched = self._tag_uids(s_tags)
                 if s_status:
-                    keep = False
-                    if task['status']:
-                        # searching for status allows use of the '+' OR
-                        # operator, so if we match any status in the
-                        # list then keep the entry
-                        for this_status in s_status:
-                            if this_status == task['status']:
-                                keep = True
-                    if not keep:
-                        remove = True
-                if s_parent:
-                    if task['parent']:
-                        if s_parent != task['parent']:
-                            remove = True
-                    else:
-                        remove = True
-                if s_priority:
-                    if task['priority']:
-                        begin, end = _parse_pri_range(s_priority)
-                        if not begin <= task['priority'] <= end:
-                            remove = True
-                    else:
-                        remove = True
-                if s_percent:
-                    if task['percent']:
-                        begin, end = _parse_perc_range(s_percent)
-                        if not begin <= task['percent'] <= end:
-                            remove = True
-                    else:
-                        remove = True
-                if s_start:
-                    if task['start']:
-                        begin, end = _parse_dt_range(s_start)
-                        if not begin <= task['start'] <= end:
-                            remove = True
-                    else:
-                        remove = True
-                if s_due:
-                    if task['due']:
-                        begin, end = _parse_dt_range(s_due)
-                        if not begin <= task['due'] <= end:
-                            remove = True
-                    else:
-                        remove = True
-                if s_started:
-                    if task['started']:
-                        begin, end = _parse_dt_range(s_started)
-                        if not begin <= task['started'] <= end:
-                            remove = True
+                    statuses = self._status_uids(s_status)
+                    if matched is None:
+                        matched = statuses
                     else:
-                        remove = True
-                if s_completed:
-                    if task['completed']:
-                        begin, end = _parse_dt_range(s_completed)
-                        if not begin <= task['completed'] <= end:
-                            remove = True
-                    else:
-                        remove = True
-                if s_notes:
-                    if task['notes']:
-                        if s_notes not in task['notes'].lower():
-                            remove = True
-                    else:
-                        remove = True
-                if remove:
-                    not_match.append(uid)
+                        matched &= statuses
+                candidates = [uid for uid in self.tasks if uid in matched]
 
-        # remove the tasks that didn't match search criteria
-        for uid in not_match:
-            this_tasks.pop(uid)
+        # with no criteria (e.g., 'any') every task matches
+        if not exclude_checks and not search_checks:
+            return list(candidates)
 
-        return this_tasks
+        # apply one criterion at a time to the remaining tasks, so each
+        # pass is a tight comprehension and later criteria only see the
+        # tasks that are still in the running
+        rows = [(uid, self._parse_task(uid)) for uid in candidates]
+        for check in exclude_checks:
+            rows = [row for row in rows if not check(*row)]
+        for check in search_checks:
+            rows = [row for row in rows if check(*row)]
+
+        return [uid for uid, task in rows]
 
     def _print_task_list(self, tasks, view, pager=False, project=None):
         """Print the formatted task list.
@@ -2178,7 +2419,7 @@ class Tasks():
             project (str):  filter the list by project.
 
         """
-        console = Console()
+        console = self.console
         if project:
             title = f"Tasks - {view} ({project})"
         else:
@@ -2187,40 +2428,13 @@ class Tasks():
         task_table = Table(
             title=title,
             title_style=self.style_title,
-            title_justify="left",
-            box=box.SIMPLE,
-            show_header=False,
-            show_lines=False,
-            pad_edge=False,
-            collapse_padding=False,
-            padding=(0, 0, 0, 0))
+            **SECTION_TABLE_OPTIONS)
         # single column
         task_table.add_column("column1")
         # task list/tree
         if tasks:
-            for task in tasks:
-                if tasks[task]:
-                    ftask = self._format_task(
-                        task,
-                        parent=True,
-                        project=project)
-                    task_table.add_row(ftask)
-                    subtask_table = Table(
-                        title=None,
-                        box=None,
-                        show_header=False,
-                        show_lines=False,
-                        pad_edge=True,
-                        collapse_padding=False,
-                        padding=(0, 0, 0, 4))
-                    for subtask in tasks[task]:
-                        fsubtask = self._format_task(subtask, subtask=True)
-                        subtask_table.add_row(fsubtask)
-                    task_table.add_row(subtask_table)
-                else:
-                    ftask = self._format_task(task)
-                    task_table.add_row(ftask)
-                task_table.add_row("")
+            for row in self._format_task_batch(tasks, project):
+                task_table.add_row(row)
         else:
             task_table.add_row(f"None{' '*21}")
         # single-column layout
@@ -2240,6 +2454,196 @@ class Tasks():
         else:
             console.print(layout)
 
+    def _priority_style(self, priority):
+        """Get the style for a task priority.
+
+        Args:
+            priority (int): the task priority.
+
+        Returns:
+            style (obj):    the rich Style() for the priority.
+
+        """
+        return self.priority_styles[
+            bisect.bisect_left(self.priority_thresholds, priority)]
+
+    def _project_uids(self, project):
+        """Get the uids of tasks in a project using the project index.
+
+        Args:
+            project (str):  the project name.
+
+        Returns:
+            uids (set): the uids of tasks in the project.
+
+        """
+        if self.project_index is None:
+            self._make_indexes()
+        return self.project_index.get(project, set())
+
+    def _rank_by_priority(self, uids):
+        """Sort a subset of tasks by priority using the priority ranking
+        (in the same order as _sort_tasks() on all tasks).
+
+        Args:
+            uids (set):     the tasks to sort.
+
+        Returns:
+            uids (list):    the sorted tasks.
+
+        """
+        if self.priority_rank is None:
+            self._make_indexes()
+        return sorted(uids, key=lambda x: self.priority_rank[x])
+
+    def _read_file_cache(self):
+        """Read previously parsed task file data from `cache_file`.
+        Entries for files changed shortly before the cache was written
+        are left out, so those files are read again.
+
+        Returns:
+            cache (dict):   (mtime, ctime, size) signature and parsed
+        data for each task file, keyed by file path.
+
+        """
+        def _decode_dates(obj):
+            """Restore the dates and datetimes in the cached data.
+
+            Args:
+                obj (dict): a decoded JSON object.
+
+            Returns:
+                obj (obj):  the object, or the date or datetime it
+            encodes.
+
+            """
+            if '__datetime__' in obj:
+                return datetime.fromisoformat(obj['__datetime__'])
+            elif '__date__' in obj:
+                return date.fromisoformat(obj['__date__'])
+            return obj
+
+        cache = {}
+        if self.cache_file and os.path.isfile(self.cache_file):
+            try:
+                with open(
+                        self.cache_file, "r", encoding="utf-8") as cache_file:
+                    data = json.load(cache_file, object_hook=_decode_dates)
+                if (isinstance(data, dict) and
+                        data.get('version') == APP_VERS):
+                    settled = data['written'] - CACHE_RACY_NS
+                    for filename, (signature, task) in data['files'].items():
+                        if signature[0] < settled and signature[1] < settled:
+                            cache[filename] = (tuple(signature), task)
+            except (OSError, AttributeError, IndexError, KeyError,
+                    TypeError, ValueError):
+                # an unreadable cache is simply rebuilt
+                cache = {}
+        return cache
+
+    def _reminder_summary(self, task):
+        """Build the reminder text for a task: the task summary line
+        followed by location, tags, dates and history lines.
+
+        Args:
+            task (dict):    the parsed task.
+
+        Returns:
+            summary (str):  the reminder text.
+
+        """
+        alias = task['alias']
+        description = task['description']
+        location = task['location']
+        status = task['status']
+        priority = task['priority']
+        percent = task['percent']
+        start = task['start']
+        due = task['due']
+        started = task['started']
+        completed = task['completed']
+        tags = task['tags']
+        status = status.upper() if status else "TODO"
+        if start:
+            startstr = (
+                "start: "
+                f"{self._format_timestamp(start, True)} "
+            )
+        else:
+            startstr = ""
+        if due:
+            duestr = (
+                "due: "
+                f"{self._format_timestamp(due, True)}"
+            )
+        else:
+            duestr = ""
+        if start or due:
+            dateline = f"\n + {startstr}{duestr}"
+        else:
+            dateline = ""
+        if started:
+            startedstr = (
+                "started: "
+                f"{self._format_timestamp(started, True)} "
+            )
+        else:
+            startedstr = ""
+        if completed:
+            completedstr = (
+                "completed: "
+                f"{self._format_timestamp(completed, True)}"
+            )
+        else:
+            completedstr = ""
+        if started or completed:
+            historyline = f"\n + {startedstr}{completedstr}"
+        else:
+            historyline = ""
+        notesflag = "*" if task['notes'] else ""
+        tagline = f"\n + tags: {','.join(tags)}" if tags else ""
+        locationline = f"\n + location: {location}" if location else ""
+        percentstr = f" ({percent}%)" if percent else ""
+        prioritystr = f"[{priority}] " if priority else ""
+        return (
+            f"({alias}) [{status}] {prioritystr}"
+            f"{description}{notesflag}{percentstr}"
+            f"{locationline}{tagline}{dateline}"
+            f"{historyline}"
+        )
+
+    def _reset_indexes(self):
+        """Drop the date, status, project, tag and priority indexes so
+        they are rebuilt from the current task data on next use.
+
+        """
+        self.date_index = None
+        self.status_index = None
+        self.project_index = None
+        self.tag_index = None
+        self.priority_rank = None
+
+    def _rrule_dates(self, rruleobj, key):
+        """Get the valid datetimes from a list of specific dates in a
+        recurrence rule (i.e., 'date' or 'except').
+
+        Args:
+            rruleobj (dict):    a dict of recurrence rule parameters.
+            key (str):          the rule parameter containing the dates.
+
+        Returns:
+            dates (list):   a list of datetime objects.
+
+        """
+        dates = []
+        entries = rruleobj.get(key)
+        if entries:
+            for entry in entries:
+                new_dt = self._datetime_or_none(entry)
+                if new_dt:
+                    dates.append(new_dt)
+        return dates
+
     def _sort_tasks(self, tasks, sortby, reverse=False):
         """Sort a list of tasks by a parameter and return a sorted dict.
 
@@ -2252,85 +2656,78 @@ class Tasks():
             uids (dict):    a sorted dict of tasks.
 
         """
-        fifouids = {}
+        if sortby == 'priority':
+            default = 1000
+        elif sortby == 'percent':
+            default = 0
+        else:
+            default = ""
+        numeric = sortby in ['priority', 'percent']
+        alltasks = self.tasks
+        to_integer = self._integer_or_default
+        sortlist = []
         for uid in tasks:
-            sort = self.tasks[uid].get(sortby)
-            if sort and sortby == 'priority':
-                sort = self._integer_or_default(sort, 1000)
-            if sort and sortby == 'percent':
-                sort = self._integer_or_default(sort, 0)
+            sort = alltasks[uid].get(sortby)
+            if sort and numeric:
+                sort = to_integer(sort, default)
             if not sort:
-                if sortby == 'priority':
-                    sort = 1000
-                elif sortby == 'percent':
-                    sort = 0
-                else:
-                    sort = ""
-            fifouids[uid] = sort
-        sortlist = sorted(
-            fifouids.items(), key=lambda x: x[1], reverse=reverse
-        )
+                sort = default
+            sortlist.append((uid, sort))
+        sortlist.sort(key=itemgetter(1), reverse=reverse)
         uids = dict(sortlist)
         return uids
 
-    def _stylize_by_status(self, textstr, status):
-        """Stylize a text string based on the task status and return a
-        rich.Text() object stylized appropriately.
+    def _status_style(self, status):
+        """Get the style for a task status.
 
         Args:
-            textstr (str):  the string to stylize.
-            status (str):   the task status.
+            status (str):   the task status (already lower-cased by
+        _parse_task()).
 
         Returns:
-            styled (obj):   the stylized Text() object.
+            style (obj):    the rich Style() for the status.
 
         """
-        status = status.lower()
-        styled = Text(textstr)
-
-        if status == "done":
-            styled.stylize(self.style_status_done)
-        elif status == "todo":
-            styled.stylize(self.style_status_todo)
-        elif status == "inprogress":
-            styled.stylize(self.style_status_inprogress)
-        elif status == "waiting":
-            styled.stylize(self.style_status_waiting)
-        elif status == "onhold":
-            styled.stylize(self.style_status_onhold)
-        elif status == "blocked":
-            styled.stylize(self.style_status_blocked)
-        elif status == "cancelled":
-            styled.stylize(self.style_status_cancelled)
-        else:
-            styled.stylize(self.style_status_default)
+        return self.status_styles.get(status, self.style_status_default)
 
-        return styled
-
-    def _stylize_by_priority(self, textstr, priority):
-        """Stylize a text string based on the task priority and return a
-        rich.Text() object stylized appropriately.
+    def _status_uids(self, statuses, exclude=False):
+        """Get the uids of tasks with (or without) particular statuses
+        using the status index.
 
         Args:
-            textstr (str):  the string to stylize.
-            priority (str):   the task priority.
+            statuses (list):    the statuses to match.
+            exclude (bool):     return tasks that do not have any of the
+        statuses instead (optional).
 
         Returns:
-            styled (obj):   the stylized Text() object.
+            uids (set): the uids of matching tasks.
 
         """
-        styled = Text(textstr)
-
-        if priority <= self.priority_high:
-            styled.stylize(self.style_priority_high)
-        elif priority <= self.priority_medium:
-            styled.stylize(self.style_priority_medium)
-        elif priority <= self.priority_normal:
-            styled.stylize(self.style_priority_normal)
-        else:
-            styled.stylize(self.style_priority_low)
+        if self.status_index is None:
+            self._make_indexes()
+        uids = set()
+        for status, members in self.status_index.items():
+            if (status in statuses) != exclude:
+                uids |= members
+        return uids
+
+    def _tag_uids(self, tags):
+        """Get the uids of tasks with any of the given tags using the
+        tag index.
 
-        return styled
+        Args:
+            tags (set):     the tags to match.
+
+        Returns:
+            uids (set): the uids of matching tasks.
+
+        """
+        if self.tag_index is None:
+            self._make_indexes()
+        uids = set()
+        for tag in tags:
+            uids |= self.tag_index.get(tag, set())
+        return uids
 
     def _uid_from_alias(self, alias):
         """Get the uid for a valid alias.
@@ -2342,14 +2739,7 @@ class Tasks():
             uid (str or None): The uid that matches the submitted alias.
 
         """
-        alias = alias.lower()
-        uid = None
-        for task in self.tasks:
-            this_alias = self.tasks[task].get("alias")
-            if this_alias:
-                if this_alias == alias:
-                    uid = task
-        return uid
+        return self.alias_index.get(alias.lower())
 
     def _verify_data_dir(self):
         """Create the tasks data directory if it doesn't exist."""
@@ -2368,6 +2758,46 @@ class Tasks():
                 "You don't have read/write/execute permissions to "
                 f"{self.data_dir}")
 
+    def _write_file_cache(self, cache):
+        """Write parsed task file data to `cache_file` as JSON.
+
+        Args:
+            cache (dict):   (mtime, ctime, size) signature and parsed
+        data for each task file, keyed by file path.
+
+        """
+        def _encode_dates(obj):
+            """Encode the dates and datetimes in task data for JSON.
+
+            Args:
+                obj (obj):  an object that JSON can't encode.
+
+            Returns:
+                (dict):     the encoded date or datetime.
+
+            """
+            if isinstance(obj, datetime):
+                return {'__datetime__': obj.isoformat()}
+            elif isinstance(obj, date):
+                return {'__date__': obj.isoformat()}
+            raise TypeError(f"can't cache {type(obj).__name__} values")
+
+        if self.cache_file:
+            temp_file = f"{self.cache_file}.tmp"
+            data = {
+                'version': APP_VERS,
+                'written': time.time_ns(),
+                'files': cache
+            }
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                with open(temp_file, "w", encoding="utf-8") as cache_file:
+                    json.dump(data, cache_file, default=_encode_dates)
+                os.replace(temp_file, self.cache_file)
+            except (OSError, TypeError, ValueError):
+                # the cache is optional, so failures are not reported
+                pass
+
     @staticmethod
     def _write_yaml_file(data, filename):
         """Write YAML data to a file.
@@ -2377,13 +2807,16 @@ class Tasks():
             filename (str): the location to write the data.
 
         """
+        # emit the whole document first so the file gets one write
+        # rather than one per YAML event
+        output = yaml.dump(
+            data,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False)
         with open(filename, "w",
                   encoding="utf-8") as out_file:
-            yaml.dump(
-                data,
-                out_file,
-                default_flow_style=False,
-                sort_keys=False)
+            out_file.write(output)
 
     def add_another_reminder(self):
         """Asks if the user wants to add another reminder."""
@@ -2475,8 +2908,15 @@ class Tasks():
                 archive_file = os.path.join(
                     archive_dir, os.path.basename(filename))
                 try:
-                    shutil.move(filename, archive_file)
-                except IOError:
+                    try:
+                        # a rename, unless the archive directory is on
+                        # another filesystem
+                        os.replace(filename, archive_file)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(filename, archive_file)
+                except OSError:
                     msg = f"failure moving {filename}"
                     if ignore:
                         self._error_pass(msg)
@@ -2497,18 +2937,15 @@ class Tasks():
             return success
 
         archive_dir = os.path.join(self.data_dir, "archive")
-        if not os.path.exists(archive_dir):
-            try:
-                os.makedirs(archive_dir)
-            except IOError:
-                msg = (
-                    f"{archive_dir} doesn't exist and can't be created"
-                )
-                if not self.interactive:
-                    self._error_exit(msg)
-                else:
-                    self._error_pass(msg)
-                    return
+        try:
+            os.makedirs(archive_dir, exist_ok=True)
+        except OSError:
+            msg = f"{archive_dir} doesn't exist and can't be created"
+            if not self.interactive:
+                self._error_exit(msg)
+            else:
+                self._error_pass(msg)
+                return
 
         alias = alias.lower()
         uid = self._uid_from_alias(alias)
@@ -2530,8 +2967,7 @@ class Tasks():
                     subtasks = self.parents[uid]
                     for task in subtasks:
                         _move_file(task, archive_dir, ignore=True)
-                    print(msg)
-                elif result:
+                if result:
                     print(msg)
             else:
                 print("Cancelled.")
@@ -2612,8 +3048,7 @@ class Tasks():
                     subtasks = self.parents[uid]
                     for task in subtasks:
                         _remove_file(task, ignore=True)
-                    print(msg)
-                elif result:
+                if result:
                     print(msg)
             else:
                 print("Cancelled")
@@ -2652,7 +3087,9 @@ class Tasks():
             except subprocess.SubprocessError:
                 self._handle_error("failure editing config file")
             else:
-                if self.interactive:
+                # only reload if the file was actually changed
+                if (self.interactive and
+                        self._config_signature() != self.config_signature):
                     self._parse_config()
                     self.refresh()
         else:
@@ -2669,6 +3106,10 @@ class Tasks():
         redirection is not possible.
 
         """
+        # formatted timestamps, keyed by datetime. the output is in UTC,
+        # so datetimes for the same instant share an entry.
+        timestamps = {}
+
         def _export_timestamp(timeobj):
             """Print a datetime string in iCalendar-compatible format.
 
@@ -2679,204 +3120,208 @@ class Tasks():
                 timestr (str):  a datetime string.
 
             """
-            timestr = (timeobj.astimezone(tz=timezone.utc)
-                       .strftime("%Y%m%dT%H%M%SZ"))
+            timestr = timestamps.get(timeobj)
+            if timestr is None:
+                utc = timeobj.astimezone(tz=timezone.utc)
+                timestr = (
+                    f"{utc.year:04d}{utc.month:02d}{utc.day:02d}T"
+                    f"{utc.hour:02d}{utc.minute:02d}{utc.second:02d}Z")
+                timestamps[timeobj] = timestr
             return timestr
 
-        def _export_wrap(text, length=75):
-            """Wraps text that exceeds a given line length, with an
-            indentation of one space on the next line.
-            Args:
-                text (str): the text to be wrapped.
-                length (int): the maximum line length (default: 75).
-            Returns:
-                wrapped (str): the wrapped text.
-            """
-            wrapper = TextWrapper(
-                width=length,
-                subsequent_indent=' ',
-                drop_whitespace=False,
-                break_long_words=True)
-            wrapped = '\r\n'.join(wrapper.wrap(text))
-            return wrapped
+        # one wrapper for all the folded lines
+        wrapper = TextWrapper(
+            subsequent_indent=' ',
+            drop_whitespace=False,
+            break_long_words=True)
+
+        def _export_wrap(text, length=75):
+            """Wraps text that exceeds a given line length, with an
+            indentation of one space on the next line.
+            Args:
+                text (str): the text to be wrapped.
+                length (int): the maximum line length (default: 75).
+            Returns:
+                wrapped (str): the wrapped text.
+            """
+            # short lines without tabs or line breaks are left as-is
+            if len(text) <= length and text.isprintable():
+                return text
+            wrapper.width = length
+            wrapped = '\r\n'.join(wrapper.wrap(text))
+            return wrapped
+
+        def _export_vtodo(uid, now):
+            """Build the VTODO component for a task.
+
+            Args:
+                uid (str):  the uid of the task.
+                now (str):  the timestamp for a missing created or
+            updated date.
+
+            Returns:
+                vtodo (str):    the VTODO component.
+
+            """
+            task = self._parse_task(uid)
+            if task['created']:
+                created = _export_timestamp(task['created'])
+            else:
+                created = now
+            if task['updated']:
+                updated = _export_timestamp(task['updated'])
+            else:
+                updated = now
+            description = task['description']
+            tags = task['tags']
+            if tags:
+                tags = ','.join(tags).upper()
+            status = task['status']
+            notes = task['notes']
+            parent = task['parent']
+            if parent:
+                # parents are already lower-cased by _parse_task()
+                parent = self.alias_index.get(parent)
+            priority = task['priority']
+            percent = task['percent']
+            start = task['start']
+            due = task['due']
+            completed = task['completed']
+            reminders = task['reminders']
+            rrule = task['rrule']
+
+            vtodo = [
+                "BEGIN:VTODO\r\n"
+                f"UID:{uid}\r\n"
+                f"DTSTAMP:{updated}\r\n"
+                f"CREATED:{created}\r\n"
+            ]
+            if description:
+                summarytxt = _export_wrap(f"SUMMARY:{description}")
+                vtodo.append(f"{summarytxt}\r\n")
+            if status:
+                # ical has limited range of valid status values
+                status = ICAL_STATUS.get(status, "IN-PROCESS")
+                vtodo.append(f"STATUS:{status}\r\n")
+            if due:
+                due = _export_timestamp(due)
+                vtodo.append(f"DUE:{due}\r\n")
+            if start:
+                start = _export_timestamp(start)
+                vtodo.append(f"DTSTART:{start}\r\n")
+            if completed:
+                completed = _export_timestamp(completed)
+                vtodo.append(f"COMPLETED:{completed}\r\n")
+            if percent:
+                vtodo.append(f"PERCENT-COMPLETE:{percent}\r\n")
+            if priority:
+                vtodo.append(f"PRIORITY:{priority}\r\n")
+            if tags:
+                categoriestxt = _export_wrap(f"CATEGORIES:{tags}")
+                vtodo.append(f"{categoriestxt}\r\n")
+            if rrule:
+                items = [(key.lower(), key, value)
+                         for key, value in rrule.items() if value]
+                rdate = ','.join(
+                    _export_timestamp(this_dt)
+                    for lkey, key, value in items if lkey == "date"
+                    for this_dt in value)
+                exdate = ','.join(
+                    _export_timestamp(this_dt)
+                    for lkey, key, value in items if lkey == "except"
+                    for this_dt in value)
+                rrulekv = [
+                    f"{key}={_export_timestamp(value)}"
+                    if lkey == "until" else f"{key}={value}"
+                    for lkey, key, value in items
+                    if lkey not in ("date", "except")]
+                rrulestr = ';'.join(rrulekv).upper()
+                rruletxt = _export_wrap(f"RRULE:{rrulestr}")
+                vtodo.append(f"{rruletxt}\r\n")
+                if rdate:
+                    rdatetxt = _export_wrap(f"RDATE:{rdate}")
+                    vtodo.append(f"{rdatetxt}\r\n")
+                if exdate:
+                    exdatetxt = _export_wrap(f"EXDATE:{exdate}")
+                    vtodo.append(f"{exdatetxt}\r\n")
+            if parent:
+                vtodo.append(f"RELATED-TO:{parent}\r\n")
+            if notes:
+                notes = notes.replace('\n', '\\n')
+                descriptiontxt = _export_wrap(f"DESCRIPTION:{notes}")
+                vtodo.append(f"{descriptiontxt}\r\n")
+            if reminders:
+                for reminder in reminders:
+                    remind = reminder.get('remind')
+                    notify = reminder.get('notify')
+                    if remind:
+                        remind = remind.upper()
+                        vtodo.append("BEGIN:VALARM\r\n")
+                        dt_trigger = self._datetime_or_none(remind)
+                        if dt_trigger:
+                            trigger = _export_timestamp(dt_trigger)
+                            vtodo.append(
+                                f"TRIGGER;VALUE=DATE-TIME:{trigger}\r\n")
+                        else:
+                            for prefix, duration, prop in ICAL_TRIGGERS:
+                                if remind.startswith(prefix):
+                                    trigger = (
+                                        duration + remind[len(prefix):])
+                                    triggertxt = _export_wrap(
+                                        f"{prop}:{trigger}")
+                                    vtodo.append(f"{triggertxt}\r\n")
+                                    break
+                        if notify:
+                            notify = notify.upper()
+                            if notify not in ["DISPLAY", "EMAIL"]:
+                                notify = "DISPLAY"
+                        else:
+                            notify = "DISPLAY"
+                        vtodo.append(f"ACTION:{notify}\r\n")
+                        if notify == "EMAIL" and self.user_email:
+                            emailtxt = _export_wrap(
+                                    f"ATTENDEE:mailto:{self.user_email}")
+                            vtodo.append(f"{emailtxt}\r\n")
+                        vtodo.append("END:VALARM\r\n")
+
+            vtodo.append("END:VTODO\r\n")
+            return ''.join(vtodo)
 
         this_tasks = self._perform_search(term)
+        header = (
+            "BEGIN:VCALENDAR\r\n"
+            "VERSION:2.0\r\n"
+            f"PRODID:-//sdoconnell.net/{APP_NAME} {APP_VERS}//EN\r\n"
+        )
+        footer = "END:VCALENDAR\r\n"
+        # timestamp for tasks missing created/updated dates
+        now = _export_timestamp(datetime.now(tz=self.ltz))
 
-        if len(this_tasks) > 0:
-            ical = (
-                "BEGIN:VCALENDAR\r\n"
-                "VERSION:2.0\r\n"
-                f"PRODID:-//sdoconnell.net/{APP_NAME} {APP_VERS}//EN\r\n"
-            )
-            for uid in this_tasks:
-                task = self._parse_task(uid)
-                if task['created']:
-                    created = _export_timestamp(task['created'])
-                else:
-                    created = _export_timestamp(
-                            datetime.now(tz=self.ltz))
-                if task['updated']:
-                    updated = _export_timestamp(task['updated'])
-                else:
-                    updated = _export_timestamp(
-                            datetime.now(tz=self.ltz))
-                description = task['description']
-                tags = task['tags']
-                if tags:
-                    tags = ','.join(tags).upper()
-                status = task['status']
-                notes = task['notes']
-                parent = task['parent']
-                if parent:
-                    parent = self._uid_from_alias(parent)
-                priority = task['priority']
-                percent = task['percent']
-                start = task['start']
-                due = task['due']
-                completed = task['completed']
-                reminders = task['reminders']
-                rrule = task['rrule']
-
-                vtodo = (
-                    "BEGIN:VTODO\r\n"
-                    f"UID:{uid}\r\n"
-                    f"DTSTAMP:{updated}\r\n"
-                    f"CREATED:{created}\r\n"
-                )
-                if description:
-                    summarytxt = _export_wrap(f"SUMMARY:{description}")
-                    vtodo += f"{summarytxt}\r\n"
-                if status:
-                    # ical has limited range of valid status values
-                    if status == "todo":
-                        status = "NEEDS-ACTION"
-                    elif status == "done":
-                        status = "COMPLETED"
-                    elif status == "cancelled":
-                        status = "CANCELLED"
-                    else:
-                        status = "IN-PROCESS"
-                    vtodo += f"STATUS:{status}\r\n"
-                else:
-                    # default if None
-                    status = "NEEDS-ACTION"
-                if due:
-                    due = _export_timestamp(due)
-                    vtodo += f"DUE:{due}\r\n"
-                if start:
-                    start = _export_timestamp(start)
-                    vtodo += f"DTSTART:{start}\r\n"
-                if completed:
-                    completed = _export_timestamp(completed)
-                    vtodo += f"COMPLETED:{completed}\r\n"
-                if percent:
-                    vtodo += f"PERCENT-COMPLETE:{percent}\r\n"
-                if priority:
-                    vtodo += f"PRIORITY:{priority}\r\n"
-                if tags:
-                    categoriestxt = _export_wrap(f"CATEGORIES:{tags}")
-                    vtodo += f"{categoriestxt}\r\n"
-                if rrule:
-                    rdate = None
-                    exdate = None
-                    rrulekv = []
-                    for key, value in rrule.items():
-                        if key.lower() == "until" and value:
-                            value = _export_timestamp(value)
-                            rrulekv.append(f"{key}={value}")
-                        elif key.lower() == "date" and value:
-                            rdate_dates = []
-                            for this_dt in value:
-                                rdate_dates.append(
-                                        _export_timestamp(this_dt))
-                            rdate = ','.join(rdate_dates)
-                        elif key.lower() == "except" and value:
-                            except_dates = []
-                            for this_dt in value:
-                                except_dates.append(
-                                        _export_timestamp(this_dt))
-                            exdate = ','.join(except_dates)
-                        elif value:
-                            rrulekv.append(f"{key}={value}")
-                    rrulestr = ';'.join(rrulekv).upper()
-                    rruletxt = _export_wrap(f"RRULE:{rrulestr}")
-                    vtodo += f"{rruletxt}\r\n"
-                    if rdate:
-                        rdatetxt = _export_wrap(f"RDATE:{rdate}")
-                        vtodo += f"{rdatetxt}\r\n"
-                    if exdate:
-                        exdatetxt = _export_wrap(f"EXDATE:{exdate}")
-                        vtodo += f"{exdatetxt}\r\n"
-                if parent:
-                    vtodo += f"RELATED-TO:{parent}\r\n"
-                if notes:
-                    notes = notes.replace('\n', '\\n')
-                    descriptiontxt = _export_wrap(f"DESCRIPTION:{notes}")
-                    vtodo += f"{descriptiontxt}\r\n"
-                if reminders:
-                    for reminder in reminders:
-                        remind = reminder.get('remind')
-                        notify = reminder.get('notify')
-                        if remind:
-                            remind = remind.upper()
-                            vtodo += "BEGIN:VALARM\r\n"
-                            dt_trigger = self._datetime_or_none(remind)
-                            if dt_trigger:
-                                trigger = _export_timestamp(dt_trigger)
-                                vtodo += (
-                                    f"TRIGGER;VALUE=DATE-TIME:{trigger}\r\n")
-                            elif remind.startswith("START-"):
-                                trigger = remind.replace('START-', '-PT')
-                                triggertxt = _export_wrap(
-                                    f"TRIGGER:{trigger}")
-                                vtodo += f"{triggertxt}\r\n"
-                            elif remind.startswith("START+"):
-                                trigger = remind.replace('START+', 'PT')
-                                triggertxt = _export_wrap(
-                                    f"TRIGGER:{trigger}")
-                                vtodo += f"{triggertxt}\r\n"
-                            elif remind.startswith("END-"):
-                                trigger = remind.replace('END-', '-PT')
-                                triggertxt = _export_wrap(
-                                    f"TRIGGER;RELATED=END:{trigger}")
-                                vtodo += f"{triggertxt}\r\n"
-                            elif remind.startswith("END+"):
-                                trigger = remind.replace('END-', 'PT')
-                                triggertxt = _export_wrap(
-                                    f"TRIGGER;RELATED=END:{trigger}")
-                                vtodo += f"{triggertxt}\r\n"
-                            if notify:
-                                notify = notify.upper()
-                                if notify not in ["DISPLAY", "EMAIL"]:
-                                    notify = "DISPLAY"
-                            else:
-                                notify = "DISPLAY"
-                            vtodo += f"ACTION:{notify}\r\n"
-                            if notify == "EMAIL" and self.user_email:
-                                emailtxt = _export_wrap(
-                                        f"ATTENDEE:mailto:{self.user_email}")
-                                vtodo += f"{emailtxt}\r\n"
-                            vtodo += "END:VALARM\r\n"
-
-                vtodo += "END:VTODO\r\n"
-                ical += vtodo
-            ical += "END:VCALENDAR\r\n"
-
-            output = ical
-        else:
-            output = "No records found."
+        # write each task as it is built rather than holding the whole
+        # calendar in memory
         if filename:
-            filename = os.path.expandvars(os.path.expanduser(filename))
+            filename = expand_path(filename)
             try:
-                with open(filename, "w",
-                          encoding="utf-8") as ical_file:
-                    ical_file.write(output)
+                with open(filename, "wb") as ical_file:
+                    if this_tasks:
+                        ical_file.write(header.encode("utf-8"))
+                        for uid in this_tasks:
+                            ical_file.write(
+                                _export_vtodo(uid, now).encode("utf-8"))
+                        ical_file.write(footer.encode("utf-8"))
+                    else:
+                        ical_file.write(b"No records found.")
             except (OSError, IOError):
                 print("ERROR: unable to write iCalendar file.")
             else:
                 print(f"iCalendar data written to {filename}.")
+        elif this_tasks:
+            sys.stdout.write(header)
+            for uid in this_tasks:
+                sys.stdout.write(_export_vtodo(uid, now))
+            print(footer)
         else:
-            print(output)
+            print("No records found.")
 
     def info(self, alias, pager=False):
         """Display info about a specific task.
@@ -2893,19 +3338,17 @@ class Tasks():
         else:
             task = self._parse_task(uid)
 
-            console = Console()
+            console = self.console
+            schedule_table = None
+            subtasks_table = None
+            reminder_table = None
+            notes_table = None
 
             # description, status, priority, tags, parent
             summary_table = Table(
                 title=f"Task info - {task['alias']}",
                 title_style=self.style_title,
-                title_justify="left",
-                box=box.SIMPLE,
-                show_header=False,
-                show_lines=False,
-                pad_edge=False,
-                collapse_padding=False,
-                padding=(0, 0, 0, 0))
+                **SECTION_TABLE_OPTIONS)
             summary_table.add_column("field", style=self.style_label)
             summary_table.add_column("data")
 
@@ -2914,20 +3357,8 @@ class Tasks():
             descriptiontxt.stylize(self.style_description)
             summary_table.add_row("description:", descriptiontxt)
 
-            # location
-            if task['location']:
-                locationtxt = Text(task['location'])
-                locationtxt.stylize(self.style_location)
-                summary_table.add_row("location:", locationtxt)
-
-            # project
-            if task['project']:
-                projecttxt = Text(task['project'])
-                projecttxt.stylize(
-                        self._make_project_style(task['project']))
-                summary_table.add_row("project:", projecttxt)
-
             # rrule
+            rruletxt = None
             if task['rrule']:
                 rrule = task['rrule']
                 rrulekv = []
@@ -2944,32 +3375,40 @@ class Tasks():
                         rrulekv.append(f"{key}={value}")
                     elif value:
                         rrulekv.append(f"{key}={value}")
-                rruletxt = Text(';'.join(rrulekv))
-                summary_table.add_row("rrule:", rruletxt)
+                rruletxt = ';'.join(rrulekv)
 
-            # status
+            # location, project, rrule, status, priority, tags, parent
+            summary_fields = []
+            if task['location']:
+                summary_fields.append(
+                    ("location:", task['location'], self.style_location))
+            if task['project']:
+                summary_fields.append(
+                    ("project:",
+                     task['project'],
+                     self._make_project_style(task['project'])))
+            if rruletxt is not None:
+                summary_fields.append(("rrule:", rruletxt, ""))
             if task['status']:
-                statustxt = self._stylize_by_status(task['status'].upper(),
-                                                    task['status'])
-                summary_table.add_row("status:", statustxt)
-
-            # priority
+                summary_fields.append(
+                    ("status:",
+                     task['status'].upper(),
+                     self._status_style(task['status'])))
             if task['priority']:
-                prioritytxt = self._stylize_by_priority(
-                    str(task['priority']), task['priority'])
-                summary_table.add_row("priority:", prioritytxt)
-
-            # tags
+                summary_fields.append(
+                    ("priority:",
+                     str(task['priority']),
+                     self._priority_style(task['priority'])))
             if task['tags']:
-                tagtxt = Text(','.join(task['tags']))
-                tagtxt.stylize(self.style_tags)
-                summary_table.add_row("tags:", tagtxt)
-
-            # parent
+                summary_fields.append(
+                    ("tags:", ','.join(task['tags']), self.style_tags))
             if task['parent']:
-                parenttxt = Text(task['parent'])
-                parenttxt.stylize(self.style_parent)
-                summary_table.add_row("parent:", parenttxt)
+                summary_fields.append(
+                    ("parent:", task['parent'], self.style_parent))
+            for label, value, style in summary_fields:
+                fieldtxt = Text(value)
+                fieldtxt.stylize(style)
+                summary_table.add_row(label, fieldtxt)
 
             # start, due, started, completed, percent
             if (task['start'] or
@@ -2980,13 +3419,7 @@ class Tasks():
                 schedule_table = Table(
                     title="Tracking",
                     title_style=self.style_title,
-                    title_justify="left",
-                    box=box.SIMPLE,
-                    show_header=False,
-                    show_lines=False,
-                    pad_edge=False,
-                    collapse_padding=False,
-                    padding=(0, 0, 0, 0))
+                    **SECTION_TABLE_OPTIONS)
                 schedule_table.add_column("field",
                                           style=self.style_label)
                 schedule_table.add_column("data")
@@ -3046,19 +3479,13 @@ class Tasks():
                     schedule_table.add_row("% complete:", percenttxt)
 
             # subtasks
-            if task['uid'] in self.parents.keys():
+            if task['uid'] in self.parents:
                 subtasks = self.parents[task['uid']]
                 if subtasks:
                     subtasks_table = Table(
                         title="Subtasks",
                         title_style=self.style_title,
-                        title_justify="left",
-                        box=box.SIMPLE,
-                        show_header=False,
-                        show_lines=False,
-                        pad_edge=False,
-                        collapse_padding=False,
-                        padding=(0, 0, 0, 0))
+                        **SECTION_TABLE_OPTIONS)
                     subtasks_table.add_column("data")
                     subtasks = self._sort_tasks(subtasks, 'priority')
                     for subtask in subtasks:
@@ -3070,13 +3497,7 @@ class Tasks():
                 reminder_table = Table(
                     title="Reminders",
                     title_style=self.style_title,
-                    title_justify="left",
-                    box=box.SIMPLE,
-                    show_header=False,
-                    show_lines=False,
-                    pad_edge=False,
-                    collapse_padding=False,
-                    padding=(0, 0, 0, 0))
+                    **SECTION_TABLE_OPTIONS)
                 reminder_table.add_column("entry")
 
                 for index, reminder in enumerate(task['reminders']):
@@ -3099,13 +3520,7 @@ class Tasks():
                 notes_table = Table(
                     title="Notes",
                     title_style=self.style_title,
-                    title_justify="left",
-                    box=box.SIMPLE,
-                    show_header=False,
-                    show_lines=False,
-                    pad_edge=False,
-                    collapse_padding=False,
-                    padding=(0, 0, 0, 0))
+                    **SECTION_TABLE_OPTIONS)
                 notes_table.add_column("data")
                 notestxt = Text(task['notes'])
                 notes_table.add_row(notestxt)
@@ -3114,13 +3529,13 @@ class Tasks():
             layout.add_column("single")
             layout.add_row("")
             layout.add_row(summary_table)
-            if 'schedule_table' in locals():
+            if schedule_table is not None:
                 layout.add_row(schedule_table)
-            if 'subtasks_table' in locals():
+            if subtasks_table is not None:
                 layout.add_row(subtasks_table)
-            if 'reminder_table' in locals():
+            if reminder_table is not None:
                 layout.add_row(reminder_table)
-            if 'notes_table' in locals():
+            if notes_table is not None:
                 layout.add_row(notes_table)
 
             # render the output with a pager if --pager or -p
@@ -3213,14 +3628,10 @@ class Tasks():
                 pager=pager,
                 project=project)
         else:
-            tasklist = []
-            for task in self.tasks:
-                if view == self.tasks[task]['alias'].lower():
-                    tasklist.append(task)
-            if tasklist:
-                # should only be one
-                uid = ''.join(tasklist)
-                if uid in self.parents.keys() and subs:
+            uid = self.alias_index.get(view)
+            if uid:
+                tasklist = [uid]
+                if uid in self.parents and subs:
                     this_tasks = self._build_tree(
                         tasklist,
                         'priority',
@@ -3288,9 +3699,9 @@ class Tasks():
                 deletions (list):   the indexes to be deleted.
                 source (list):    the list from which to remove.
             Returns:
-                source (list):    the modified list.
+                items (list):     a new list without the deleted items.
             """
-            rem_items = []
+            rem_indexes = set()
             for entry in deletions:
                 try:
                     entry = int(entry)
@@ -3298,12 +3709,9 @@ class Tasks():
                     pass
                 else:
                     if 1 <= entry <= len(source):
-                        entry -= 1
-                        rem_items.append(source[entry])
-            if rem_items:
-                for item in rem_items:
-                    source.remove(item)
-            return source
+                        rem_indexes.add(entry - 1)
+            return [item for index, item in enumerate(source)
+                    if index not in rem_indexes]
 
         def _new_or_current(new, current):
             """Return a datetime obj for the new date (if existant and
@@ -3335,42 +3743,26 @@ class Tasks():
             self._alias_not_found(alias)
         else:
             filename = self.task_files.get(uid)
-            aliases = self._get_aliases()
             task = self._parse_task(uid)
 
             if filename:
                 created = task['created']
                 u_updated = datetime.now(tz=self.ltz)
-                # start
-                if new_start:
-                    u_start = _new_or_current(new_start, task['start'])
-                else:
-                    u_start = task['start']
-                # due
-                if new_due:
-                    u_due = _new_or_current(new_due, task['due'])
-                else:
-                    u_due = task['due']
-                # started
-                if new_started:
-                    u_started = _new_or_current(new_started, task['started'])
-                else:
-                    u_started = task['started']
-                # completed
-                if new_completed:
-                    u_completed = _new_or_current(
-                                      new_completed, task['completed'])
-                else:
-                    u_completed = task['completed']
+                # start, due, started and completed
+                u_start, u_due, u_started, u_completed = (
+                    _new_or_current(new, task[field])
+                    for field, new in (
+                        ('start', new_start),
+                        ('due', new_due),
+                        ('started', new_started),
+                        ('completed', new_completed)))
                 # parent
                 # check parent for existing alias
                 if new_parent:
-                    if new_parent.lower() not in aliases:
-                        self._error_pass(
-                            f"parent '{new_parent.lower()}' not found")
+                    u_parent = new_parent.lower()
+                    if u_parent not in self.alias_index:
+                        self._error_pass(f"parent '{u_parent}' not found")
                         u_parent = None
-                    else:
-                        u_parent = new_parent.lower()
                 else:
                     u_parent = task['parent']
                 # description
@@ -3379,61 +3771,36 @@ class Tasks():
                 u_project = new_project or task['project']
                 # location
                 u_location = new_location or task['location']
-                # priority
-                if new_priority:
-                    u_priority = self._integer_or_default(
-                        new_priority, task['priority'])
-                else:
-                    u_priority = task['priority']
+                # priority and percent
+                u_priority, u_percent = (
+                    self._integer_or_default(new, task[field])
+                    if new else task[field]
+                    for field, new in (
+                        ('priority', new_priority),
+                        ('percent', new_percent)))
+                # status
+                u_status = (
+                    new_status.lower() if new_status else task['status'])
                 # tags
                 if new_tags:
                     new_tags = new_tags.lower()
+                    # start from the stored tags (not the search-only
+                    # tags_set), as strings so that tags YAML loaded as
+                    # numbers are kept and can be compared and sorted
+                    tags = task['tags'] or []
+                    if not isinstance(tags, list):
+                        tags = [tags]
+                    tags = {str(tag) for tag in tags}
                     if new_tags.startswith('+'):
-                        new_tags = new_tags[1:]
-                        new_tags = new_tags.split(',')
-                        if not task['tags']:
-                            tags = []
-                        else:
-                            tags = task['tags'].copy()
-                        for new_tag in new_tags:
-                            if new_tag not in tags:
-                                tags.append(new_tag)
-                        if tags:
-                            tags.sort()
-                            u_tags = tags
-                        else:
-                            u_tags = None
+                        u_tags = sorted(
+                            tags.union(new_tags[1:].split(','))) or None
                     elif new_tags.startswith('~'):
-                        new_tags = new_tags[1:]
-                        new_tags = new_tags.split(',')
-                        if task['tags']:
-                            tags = task['tags'].copy()
-                            for new_tag in new_tags:
-                                if new_tag in tags:
-                                    tags.remove(new_tag)
-                            if tags:
-                                tags.sort()
-                                u_tags = tags
-                            else:
-                                u_tags = None
-                        else:
-                            u_tags = None
+                        u_tags = sorted(
+                            tags.difference(new_tags[1:].split(','))) or None
                     else:
-                        u_tags = new_tags.split(',')
-                        u_tags.sort()
+                        u_tags = sorted(set(new_tags.split(',')))
                 else:
                     u_tags = task['tags']
-                # percent
-                if new_percent:
-                    u_percent = self._integer_or_default(
-                        new_percent, task['percent'])
-                else:
-                    u_percent = task['percent']
-                # status
-                if new_status:
-                    u_status = new_status.lower()
-                else:
-                    u_status = task['status']
                 # reminders
                 if add_reminder or del_reminder:
                     if task['reminders']:
@@ -3444,17 +3811,8 @@ class Tasks():
                         u_reminders = _remove_items(del_reminder,
                                                     u_reminders)
                     if add_reminder:
-                        for a_rem in add_reminder:
-                            rem_data = {}
-                            if len(a_rem) > 0:
-                                rem_data['remind'] = a_rem[0]
-                                if len(a_rem) == 2:
-                                    remtype = str(a_rem[1]).lower()
-                                    if remtype in ['display', 'email']:
-                                        rem_data['notify'] = remtype
-                                    else:
-                                        rem_data['notify'] = 'display'
-                                u_reminders.append(rem_data)
+                        u_reminders.extend(
+                            self._make_reminders(add_reminder))
                 else:
                     u_reminders = task['reminders']
 
@@ -3468,7 +3826,7 @@ class Tasks():
                 if new_notes:
                     # the new note is functionally empty or is using a
                     # placeholder from notes() to clear the notes
-                    if new_notes in [' ', ' \n', '\n']:
+                    if new_notes in CLEARED_NOTES:
                         u_notes = None
                     else:
                         u_notes = new_notes
@@ -3503,47 +3861,12 @@ class Tasks():
 
                 # check for 'cancelled' or 'done' status on rrule
                 # tasks and create new task
-                if u_rrule and u_start and u_status in ['done', 'cancelled']:
+                if u_rrule and u_start and u_status in CLOSED_STATUSES:
                     new_start, new_due = self._calc_next_recurrence(
                             u_rrule, u_start, u_due)
-                    # convert things back to strings the way new expects
-                    if u_tags:
-                        u_tags = ','.join(u_tags)
-                    if new_start:
-                        new_start = self._format_timestamp(new_start)
-                    if new_due:
-                        new_due = self._format_timestamp(new_due)
-                    if u_rrule:
-                        rrulekv = []
-                        for key, value in u_rrule.items():
-                            if key.lower() in ['date', 'except']:
-                                pretty_dates = []
-                                for item in value:
-                                    new_date = self._format_timestamp(
-                                            item, pretty=True)
-                                    pretty_dates.append(new_date)
-                                rrulekv.append(
-                                        f"{key}={','.join(pretty_dates)}")
-                            elif key.lower() == 'until':
-                                value = self._format_timestamp(
-                                        value, pretty=True)
-                                rrulekv.append(f"{key}={value}")
-                            elif value:
-                                rrulekv.append(f"{key}={value}")
-                        u_rrule = ';'.join(rrulekv)
-                    if u_reminders:
-                        new_reminders = []
-                        for entry in u_reminders:
-                            new_reminder = []
-                            remind = entry.get('remind')
-                            if remind:
-                                new_reminder.append(remind)
-                            notify = entry.get('notify')
-                            if notify:
-                                new_reminder.append(notify)
-                            new_reminders.append(new_reminder)
-                        u_reminders = new_reminders.copy()
-                    self.new(
+                    # the next occurrence carries over the values just
+                    # written, so it skips the string parsing in new()
+                    self._create_task(
                         description=u_description,
                         location=u_location,
                         priority=u_priority,
@@ -3593,24 +3916,10 @@ class Tasks():
             notes (str):        notes assigned to the task.
 
         """
-        uid = str(uuid.uuid4())
-        now = datetime.now(tz=self.ltz)
-        created = now
-        updated = now
-        alias = self._gen_alias()
-        aliases = self._get_aliases()
-        # check parent for existing alias
-        if parent:
-            if parent.lower() not in aliases:
-                self._error_pass(f"parent '{parent.lower()}' not found")
-                parent = None
         if tags:
             tags = tags.lower()
             tags = tags.split(',')
             tags.sort()
-        # set defaults for empty parameters that shouldn't be empty
-        description = description or "New task"
-        status = status or "todo"
         # integrity checks
         if start:
             start = self._datetime_or_none(start)
@@ -3626,18 +3935,7 @@ class Tasks():
             percent = self._integer_or_default(percent)
 
         if reminders:
-            new_reminders = []
-            for entry in reminders:
-                rem_data = {}
-                if len(entry) > 0:
-                    rem_data['remind'] = entry[0]
-                    if len(entry) == 2:
-                        remtype = str(entry[1]).lower()
-                        if remtype in ['display', 'email']:
-                            rem_data['notify'] = remtype
-                        else:
-                            rem_data['notify'] = 'display'
-                    new_reminders.append(rem_data)
+            new_reminders = self._make_reminders(reminders)
         else:
             new_reminders = None
 
@@ -3646,33 +3944,22 @@ class Tasks():
         else:
             new_rrule = None
 
-        filename = os.path.join(self.data_dir, f'{uid}.yml')
-        data = {
-            "task": {
-                "uid": uid,
-                "created": created,
-                "updated": updated,
-                "alias": alias,
-                "description": description,
-                "location": location,
-                "priority": priority,
-                "tags": tags,
-                "start": start,
-                "due": due,
-                "started": started,
-                "completed": completed,
-                "percent": percent,
-                "status": status,
-                "parent": parent,
-                "project": project,
-                "rrule": new_rrule,
-                "reminders": new_reminders,
-                "notes": notes
-            }
-        }
-        # write the updated file
-        self._write_yaml_file(data, filename)
-        print(f"Added task: {alias}")
+        self._create_task(
+            description=description,
+            location=location,
+            priority=priority,
+            tags=tags,
+            start=start,
+            due=due,
+            started=started,
+            completed=completed,
+            percent=percent,
+            status=status,
+            parent=parent,
+            project=project,
+            rrule=new_rrule,
+            reminders=new_reminders,
+            notes=notes)
 
     def new_task_wizard(self):
         """Prompt the user for task parameters and then call new()."""
@@ -3787,141 +4074,78 @@ class Tasks():
         """
         result_tasks = self._perform_search(term)
         if limit:
-            limit = limit.split(',')
+            limit = frozenset(limit.split(','))
         tasks_out = {}
         tasks_out['tasks'] = []
-        text_out = ""
+
+        def _json_timestamp(timeobj):
+            """Return the ISO timestamp for a datetime, or None."""
+            if timeobj:
+                return self._format_timestamp(timeobj)
+            return None
+
+        def _text_timestamp(timeobj):
+            """Return the pretty timestamp for a datetime, or ''."""
+            if timeobj:
+                return self._format_timestamp(timeobj, True)
+            return ""
+
         if len(result_tasks) > 0:
             for uid in result_tasks:
-                this_task = {}
                 task = self._parse_task(uid)
-                created = task["created"]
-                updated = task["updated"]
-                description = task["description"] or ""
-                location = task["location"] or ""
-                alias = task["alias"] or ""
-                tags = task["tags"] or []
-                status = task["status"] or ""
-                parent = task["parent"] or ""
-                priority = task["priority"] or ""
-                percent = task["percent"] or ""
-                project = task["project"] or ""
-                if created:
-                    created = self._format_timestamp(created)
-                if updated:
-                    updated = self._format_timestamp(updated)
-                if task["start"]:
-                    start = self._format_timestamp(
-                        task["start"], True)
-                    j_start = self._format_timestamp(
-                        task["start"])
-                else:
-                    start = ""
-                    j_start = None
-                if task["due"]:
-                    due = self._format_timestamp(
-                        task["due"], True)
-                    j_due = self._format_timestamp(
-                        task["due"])
-                else:
-                    due = ""
-                    j_due = None
-                if task["started"]:
-                    started = self._format_timestamp(
-                        task["started"], True)
-                    j_started = self._format_timestamp(
-                        task["started"])
-                else:
-                    started = ""
-                    j_started = None
-                if task["completed"]:
-                    completed = self._format_timestamp(
-                        task["completed"], True)
-                    j_completed = self._format_timestamp(
-                        task["completed"])
-                else:
-                    completed = ""
-                    j_completed = None
-
+                if json_output:
+                    tasks_out['tasks'].append({
+                        'uid': uid,
+                        'created': _json_timestamp(task['created']),
+                        'updated': _json_timestamp(task['updated']),
+                        'alias': task['alias'],
+                        'status': task['status'],
+                        'priority': task['priority'],
+                        'description': task['description'],
+                        'location': task['location'],
+                        'percent': task['percent'],
+                        'tags': task['tags'],
+                        'parent': task['parent'],
+                        'project': task['project'],
+                        'rrule': task['rrule'],
+                        'start': _json_timestamp(task['start']),
+                        'due': _json_timestamp(task['due']),
+                        'started': _json_timestamp(task['started']),
+                        'completed': _json_timestamp(task['completed']),
+                        'reminders': task['reminders'],
+                        'notes': task['notes']
+                    })
+                    continue
+                values = (
+                    uid,
+                    task['alias'] or "",
+                    task['status'] or "",
+                    task['priority'] or "",
+                    task['description'] or "",
+                    task['location'] or "",
+                    task['project'] or "",
+                    task['percent'] or "",
+                    task['tags'] or [],
+                    task['parent'] or "",
+                    _text_timestamp(task['start']),
+                    _text_timestamp(task['due']),
+                    _text_timestamp(task['started']),
+                    _text_timestamp(task['completed'])
+                )
                 if limit:
-                    output = ""
-                    if "uid" in limit:
-                        output += f"{uid}\t"
-                    if "alias" in limit:
-                        output += f"{alias}\t"
-                    if "status" in limit:
-                        output += f"{status}\t"
-                    if "priority" in limit:
-                        output += f"{priority}\t"
-                    if "description" in limit:
-                        output += f"{description}\t"
-                    if "location" in limit:
-                        output += f"{location}\t"
-                    if "project" in limit:
-                        output += f"{project}\t"
-                    if "percent" in limit:
-                        output += f"{percent}\t"
-                    if "tags" in limit:
-                        output += f"{tags}\t"
-                    if "parent" in limit:
-                        output += f"{parent}\t"
-                    if "start" in limit:
-                        output += f"{start}\t"
-                    if "due" in limit:
-                        output += f"{due}\t"
-                    if "started" in limit:
-                        output += f"{started}\t"
-                    if "completed" in limit:
-                        output += f"{completed}\t"
-                    if output.endswith('\t'):
-                        output = output.rstrip(output[-1])
-                    output = f"{output}\n"
+                    output = '\t'.join(
+                        str(value)
+                        for field, value in zip(QUERY_FIELDS, values)
+                        if field in limit).rstrip('\t')
                 else:
-                    output = (
-                        f"{uid}\t"
-                        f"{alias}\t"
-                        f"{status}\t"
-                        f"{priority}\t"
-                        f"{description}\t"
-                        f"{location}\t"
-                        f"{project}\t"
-                        f"{percent}\t"
-                        f"{tags}\t"
-                        f"{parent}\t"
-                        f"{start}\t"
-                        f"{due}\t"
-                        f"{started}\t"
-                        f"{completed}\n"
-                    )
-                this_task['uid'] = uid
-                this_task['created'] = created
-                this_task['updated'] = updated
-                this_task['alias'] = task['alias']
-                this_task['status'] = task['status']
-                this_task['priority'] = task['priority']
-                this_task['description'] = task['description']
-                this_task['location'] = task['location']
-                this_task['percent'] = task['percent']
-                this_task['tags'] = task['tags']
-                this_task['parent'] = task['parent']
-                this_task['project'] = task['project']
-                this_task['rrule'] = task['rrule']
-                this_task['start'] = j_start
-                this_task['due'] = j_due
-                this_task['started'] = j_started
-                this_task['completed'] = j_completed
-                this_task['reminders'] = task['reminders']
-                this_task['notes'] = task['notes']
-                tasks_out['tasks'].append(this_task)
-                text_out += f"{output}"
+                    output = '\t'.join(str(value) for value in values)
+                # text rows are written as they are built
+                sys.stdout.write(f"{output}\n")
         if json_output:
             json_out = json.dumps(tasks_out, indent=4)
             print(json_out)
-        else:
-            if text_out != "":
-                print(text_out, end="")
-            else:
-                print("No results.")
+        elif len(result_tasks) == 0:
+            print("No results.")
 
     def refresh(self):
         """Public method to refresh data."""
@@ -3944,116 +4168,52 @@ class Tasks():
         e_span = now + timedelta(seconds=seconds)
         reminders_out = {}
         reminders_out['reminders'] = []
-        for uid in self.tasks:
+        for uid, entry in self.tasks.items():
+            # most tasks have no reminders, so skip them before parsing
+            if not entry.get('reminders'):
+                continue
             task = self._parse_task(uid)
-            alias = task['alias']
-            description = task['description']
-            location = task['location']
             reminders = task['reminders']
-            notes = task['notes']
-            status = task['status']
-            priority = task['priority']
-            percent = task['percent']
+            if not reminders:
+                continue
             start = task['start']
             due = task['due']
-            started = task['started']
-            completed = task['completed']
-            tags = task['tags']
-            if reminders:
-                for reminder in reminders:
-                    remind = reminder.get('remind')
-                    notify = reminder.get('notify')
-                    if notify:
-                        if notify.lower() == "email" and self.user_email:
-                            notify = "email"
-                        else:
-                            notify = "display"
+            # the reminder text is the same for every reminder on the
+            # task, so it is only built for the first one that is due
+            summary = None
+            for reminder in reminders:
+                remind = reminder.get('remind')
+                notify = reminder.get('notify')
+                if notify:
+                    if notify.lower() == "email" and self.user_email:
+                        notify = "email"
                     else:
                         notify = "display"
-                    if remind:
-                        dt_reminder = self._calc_reminder(
-                            remind,
-                            task['start'],
-                            task['due'])
-                    if b_span <= dt_reminder <= e_span:
-                        if status:
-                            status = status.upper()
-                        else:
-                            status = "TODO"
-                        if start:
-                            startstr = (
-                                "start: "
-                                f"{self._format_timestamp(start, True)} "
-                            )
-                        else:
-                            startstr = ""
-                        if due:
-                            duestr = (
-                                "due: "
-                                f"{self._format_timestamp(due, True)}"
-                            )
-                        else:
-                            duestr = ""
-                        if start or due:
-                            dateline = f"\n + {startstr}{duestr}"
-                        else:
-                            dateline = ""
-                        if started:
-                            startedstr = (
-                                "started: "
-                                f"{self._format_timestamp(started, True)} "
-                            )
-                        else:
-                            startedstr = ""
-                        if completed:
-                            completedstr = (
-                                "completed: "
-                                f"{self._format_timestamp(completed, True)}"
-                            )
-                        else:
-                            completedstr = ""
-                        if started or completed:
-                            historyline = (
-                                f"\n + {startedstr}{completedstr}"
-                            )
-                        else:
-                            historyline = ""
-                        notesflag = "*" if task['notes'] else ""
-                        tagline = (
-                            f"\n + tags: {','.join(tags)}" if tags else ""
-                        )
-                        locationline = (
-                            "\n + location: {location}" if location else ""
-                        )
-                        percentstr = f" ({percent}%)" if percent else ""
-                        prioritystr = f"[{priority}] " if priority else ""
+                else:
+                    notify = "display"
+                if remind:
+                    dt_reminder = self._calc_reminder(remind, start, due)
+                if b_span <= dt_reminder <= e_span:
+                    if summary is None:
+                        summary = self._reminder_summary(task)
+                    if notify == "email":
+                        notes = task['notes']
                         notesblock = f"\n\n{notes}\n" if notes else ""
-                        if notify == "email":
-                            body = (
-                                f"({alias}) [{status}] {prioritystr}"
-                                f"{description}{notesflag}{percentstr}"
-                                f"{locationline}{tagline}{dateline}"
-                                f"{historyline}{notesblock}\nEOF"
-                            )
-                        else:
-                            body = (
-                                f"({alias}) [{status}] {prioritystr}"
-                                f"{description}{notesflag}{percentstr}"
-                                f"{locationline}{tagline}{dateline}"
-                                f"{historyline}"
-                            )
-                        this_reminder = {}
-                        dtstr = dt_reminder.strftime("%Y-%m-%d %H:%M")
-                        this_reminder['datetime'] = dtstr
-                        this_reminder['notification'] = notify
-                        if notify == "email":
-                            this_reminder['address'] = self.user_email
-                        this_reminder['summary'] = description
-                        this_reminder['body'] = body
-                        reminders_out['reminders'].append(this_reminder)
+                        body = f"{summary}{notesblock}\nEOF"
+                    else:
+                        body = summary
+                    this_reminder = {}
+                    dtstr = dt_reminder.strftime("%Y-%m-%d %H:%M")
+                    this_reminder['datetime'] = dtstr
+                    this_reminder['notification'] = notify
+                    if notify == "email":
+                        this_reminder['address'] = self.user_email
+                    this_reminder['summary'] = task['description']
+                    this_reminder['body'] = body
+                    reminders_out['reminders'].append(this_reminder)
         if reminders_out['reminders']:
-            json_out = json.dumps(reminders_out, indent=4)
-            print(json_out)
+            json.dump(reminders_out, sys.stdout, indent=4)
+            sys.stdout.write("\n")
 
     def search(self, term, pager=False):
         """Perform a search for tasks that match a given criteria and
@@ -4063,7 +4223,9 @@ class Tasks():
             term (str):     the criteria for which to search.
 
         """
-        this_tasks = self._perform_search(term)
+        this_tasks = {}
+        for uid in self._perform_search(term) or []:
+            this_tasks[uid] = []
         self._print_task_list(this_tasks, 'search results', pager)
 
     def start(self, alias):
@@ -4073,8 +4235,9 @@ class Tasks():
             alias (str):    the alias of the task to start.
 
         """
-        now = (datetime.now(tz=self.ltz)
-               .strftime("%Y-%m-%d %H:%M:%S"))
+        # modify() takes datetimes as well as strings, so there's no
+        # need to format the time only to have it parsed again
+        now = datetime.now(tz=self.ltz).replace(microsecond=0)
         self.modify(
             alias=alias,
             new_started=now,
@@ -4093,47 +4256,17 @@ class Tasks():
         if not uid:
             self._alias_not_found(alias)
         else:
-            allowed_fields = [
-                'tags',
-                'start',
-                'due',
-                'started',
-                'completed',
-                'priority',
-                'percent',
-                'parent',
-                'project',
-                'rrule',
-                'reminders',
-                'location'
-            ]
-            if field in allowed_fields:
-                if self.tasks[uid][field]:
+            if field in UNSET_FIELDS:
+                if self.tasks[uid].get(field):
                     self.tasks[uid][field] = None
+                    self.task_cache.pop(uid, None)
+                    self._reset_indexes()
                     task = self._parse_task(uid)
                     filename = self.task_files.get(uid)
                     if task and filename:
                         data = {
                             "task": {
-                                "uid": task['uid'],
-                                "created": task['created'],
-                                "updated": task['updated'],
-                                "alias": task['alias'],
-                                "description": task['description'],
-                                "location": task['location'],
-                                "priority": task['priority'],
-                                "tags": task['tags'],
-                                "start": task['start'],
-                                "due": task['due'],
-                                "started": task['started'],
-                                "completed": task['completed'],
-                                "percent": task['percent'],
-                                "status": task['status'],
-                                "parent": task['parent'],
-                                "project": task['project'],
-                                "rrule": task['rrule'],
-                                "reminders": task['reminders'],
-                                "notes": task['notes']
+                                key: task[key] for key in TASK_FILE_FIELDS
                             }
                         }
                         # write the updated file
@@ -4142,16 +4275,35 @@ class Tasks():
                 self._handle_error(f"cannot clear field '{field}'")
 
 
-class FSHandler(FileSystemEventHandler):
+class FSHandler():
     """Handler to watch for file changes and refresh data from files.
+    Implements the dispatch() interface of a watchdog event handler, so
+    watchdog (only needed by the interactive shell) is not imported for
+    every command.
+
+    A single save usually produces a burst of events (temporary file,
+    rename, attribute changes), so events only (re)start a timer and the
+    refresh runs once they have stopped for REFRESH_DELAY seconds.
 
     Attributes:
         shell (obj):    the calling shell object.
+        timer (obj):    the pending refresh timer, if any.
 
     """
     def __init__(self, shell):
         """Initializes an FSHandler() object."""
         self.shell = shell
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def dispatch(self, event):
+        """Dispatch a file system event from the watchdog observer.
+
+        Args:
+            event (obj):    file system event.
+
+        """
+        self.on_any_event(event)
 
     def on_any_event(self, event):
         """Refresh data in memory on data file changes.
@@ -4162,8 +4314,36 @@ class FSHandler(FileSystemEventHandler):
         """
         if event.event_type in [
                 'created', 'modified', 'deleted', 'moved']:
+            # only task files matter, not editor swap or backup files
+            # (a save by rename shows up as a move to the task file)
+            paths = [event.src_path, getattr(event, 'dest_path', '')]
+            if any(os.fsdecode(path).endswith('.yml') for path in paths):
+                with self.lock:
+                    if self.timer:
+                        self.timer.cancel()
+                    self.timer = threading.Timer(
+                        REFRESH_DELAY, self.refresh)
+                    self.timer.daemon = True
+                    self.timer.start()
+
+    def flush(self):
+        """Perform a pending refresh now rather than waiting for the
+        timer.
+
+        """
+        with self.lock:
+            pending = self.timer
+            self.timer = None
+        if pending:
+            pending.cancel()
             self.shell.do_refresh("silent")
 
+    def refresh(self):
+        """Refresh data after a burst of file system events."""
+        with self.lock:
+            self.timer = None
+        self.shell.do_refresh("silent")
+
 
 class TasksShell(Cmd):
     """Provides methods for interactive shell use.
@@ -4183,13 +4363,16 @@ class TasksShell(Cmd):
         self.tasks = tasks
 
         # start watchdog for data_dir changes
-        # and perform refresh() on changes
+        # and perform refresh() on changes (task files are only read
+        # from the top level, so the archive directory isn't watched)
+        from watchdog.observers import Observer
         observer = Observer()
         handler = FSHandler(self)
+        self.fs_handler = handler
         observer.schedule(
                 handler,
                 self.tasks.data_dir,
-                recursive=True)
+                recursive=False)
         observer.start()
 
         # class overrides for Cmd
@@ -4228,60 +4411,39 @@ class TasksShell(Cmd):
             args (str): the command arguments.
 
         """
+        newargs = args.split()
+        view = LIST_VIEW_ALIASES.get(args[:3])
         if args == "quit":
             self.do_exit("")
-        elif args.startswith("lsa"):
-            newargs = args.split()
-            newargs[0] = "all"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lso"):
-            newargs = args.split()
-            newargs[0] = "open"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lsd"):
-            newargs = args.split()
-            newargs[0] = "done"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lsn"):
-            newargs = args.split()
-            newargs[0] = "nosubs"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lss"):
-            newargs = args.split()
-            newargs[0] = "soon"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lsl"):
-            newargs = args.split()
-            newargs[0] = "late"
-            self.do_list(' '.join(newargs))
-        elif args.startswith("lst"):
-            newargs = args.split()
-            newargs[0] = "today"
+        elif view:
+            newargs[0] = view
             self.do_list(' '.join(newargs))
         elif args.startswith("ls"):
-            newargs = args.split()
-            if len(newargs) > 1:
-                self.do_list(' '.join(newargs[1:]))
-            else:
-                self.do_list("")
+            self.do_list(' '.join(newargs[1:]))
         elif args.startswith("rm"):
-            newargs = args.split()
-            if len(newargs) > 1:
-                self.do_delete(' '.join(newargs[1:]))
-            else:
-                self.do_delete("")
+            self.do_delete(' '.join(newargs[1:]))
         elif args.startswith("mod"):
-            newargs = args.split()
-            if len(newargs) > 1:
-                self.do_modify(' '.join(newargs[1:]))
-            else:
-                self.do_modify("")
+            self.do_modify(' '.join(newargs[1:]))
         else:
             print("\nNo such command. See 'help'.\n")
 
     def emptyline(self):
         """Ignore empty line entry."""
 
+    def precmd(self, line):
+        """Apply any pending data refresh before running a command, so
+        commands issued right after a change see the new data.
+
+        Args:
+            line (str): the command line.
+
+        Returns:
+            line (str): the unchanged command line.
+
+        """
+        self.fs_handler.flush()
+        return line
+
     def _set_prompt(self):
         """Set the prompt string."""
         if self.tasks.color_bold:
@@ -4299,14 +4461,7 @@ class TasksShell(Cmd):
             uid (str or None): The uid that matches the submitted alias.
 
         """
-        alias = alias.lower()
-        uid = None
-        for task in self.tasks.tasks:
-            this_alias = self.tasks.tasks[task].get("alias")
-            if this_alias:
-                if this_alias == alias:
-                    uid = task
-        return uid
+        return self.tasks.alias_index.get(alias.lower())
 
     def do_archive(self, args):
         """Archive a task.
@@ -4317,7 +4472,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.archive(str(commands[0]).lower())
+            self.tasks.archive(commands[0].lower())
         else:
             self.help_archive()
 
@@ -4329,7 +4484,13 @@ class TasksShell(Cmd):
             args (str): the command arguments, ignored.
 
         """
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            # what clear(1) writes on a VT100-style terminal: home the
+            # cursor, clear the screen and the scrollback buffer
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
 
     def do_complete(self, args):
         """Complete a task.
@@ -4340,7 +4501,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.complete(str(commands[0]).lower())
+            self.tasks.complete(commands[0].lower())
         else:
             self.help_complete()
 
@@ -4362,7 +4523,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.delete(str(commands[0]).lower())
+            self.tasks.delete(commands[0].lower())
         else:
             self.help_delete()
 
@@ -4375,7 +4536,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.edit(str(commands[0]).lower())
+            self.tasks.edit(commands[0].lower())
         else:
             self.help_edit()
 
@@ -4389,8 +4550,8 @@ class TasksShell(Cmd):
         if len(args) > 0:
             commands = args.split()
             if len(commands) == 2:
-                term = str(commands[0]).lower()
-                filename = str(commands[1])
+                term = commands[0].lower()
+                filename = commands[1]
                 self.tasks.export(term, filename)
             else:
                 self.help_export()
@@ -4416,10 +4577,10 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            alias = str(commands[0]).lower()
+            alias = commands[0].lower()
             page = False
             if len(commands) > 1:
-                if str(commands[1]) == "|":
+                if commands[1] == "|":
                     page = True
             self.tasks.info(alias, page)
         else:
@@ -4439,7 +4600,7 @@ class TasksShell(Cmd):
                 pager = True
                 args = args[:-1].strip()
             commands = args.split()
-            view = str(commands[0]).lower()
+            view = commands[0].lower()
             if len(commands) > 1:
                 project = commands[1]
             else:
@@ -4457,7 +4618,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            alias = str(commands[0]).lower()
+            alias = commands[0].lower()
             uid = self._uid_from_alias(alias)
             if not uid:
                 print(f"Alias '{alias}' not found")
@@ -4488,7 +4649,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.notes(str(commands[0]).lower())
+            self.tasks.notes(commands[0].lower())
         else:
             self.help_notes()
 
@@ -4530,7 +4691,7 @@ class TasksShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            self.tasks.start(str(commands[0]).lower())
+            self.tasks.start(commands[0].lower())
         else:
             self.help_start()
 
@@ -4771,7 +4932,7 @@ class ModShell(Cmd):
         if len(commands) < 1:
             self.help_add()
         else:
-            attr = str(commands[0]).lower()
+            attr = commands[0].lower()
             if attr == 'reminder':
                 try:
                     self.tasks.add_new_reminder(another=False)
@@ -4792,7 +4953,13 @@ class ModShell(Cmd):
             args (str): the command arguments, ignored.
 
         """
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            # what clear(1) writes on a VT100-style terminal: home the
+            # cursor, clear the screen and the scrollback buffer
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
 
     def do_completed(self, args):
         """Modify the 'completed' date on a task.
@@ -4820,7 +4987,7 @@ class ModShell(Cmd):
         if len(commands) < 2:
             self.help_delete()
         else:
-            attr = str(commands[0]).lower()
+            attr = commands[0].lower()
             index = commands[1]
             if attr == 'reminder':
                 reminder = [index]
@@ -4879,7 +5046,7 @@ class ModShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            if str(commands[0]) == "|":
+            if commands[0] == "|":
                 self.tasks.info(self.alias, True)
             else:
                 self.tasks.info(self.alias)
@@ -4928,7 +5095,7 @@ class ModShell(Cmd):
         """
         if len(args) > 0:
             commands = args.split()
-            parent = str(commands[0]).lower()
+            parent = commands[0].lower()
             self.tasks.modify(
                 alias=self.alias,
                 new_parent=parent)
@@ -5035,8 +5202,8 @@ class ModShell(Cmd):
 
         """
         if len(args) > 0:
-            commands = args.split()
-            status = str(commands[0]).lower()
+            commands = args.split(maxsplit=1)
+            status = commands[0].lower()
             self.tasks.modify(
                 alias=self.alias,
                 new_status=status)
@@ -5051,8 +5218,8 @@ class ModShell(Cmd):
 
         """
         if len(args) > 0:
-            commands = args.split()
-            tags = str(commands[0])
+            commands = args.split(maxsplit=1)
+            tags = commands[0]
             self.tasks.modify(
                 alias=self.alias,
                 new_tags=tags)
@@ -5065,26 +5232,12 @@ class ModShell(Cmd):
             args (str):     the command arguments.
         """
         if len(args) > 0:
-            commands = args.split()
+            commands = args.split(maxsplit=2)
             if len(commands) > 2:
                 self.help_unset()
             else:
-                field = str(commands[0]).lower()
-                allowed_fields = [
-                        'tags',
-                        'start',
-                        'due',
-                        'started',
-                        'completed',
-                        'priority',
-                        'percent',
-                        'parent',
-                        'project',
-                        'rrule',
-                        'reminders',
-                        'location'
-                ]
-                if field in allowed_fields:
+                field = commands[0].lower()
+                if field in UNSET_FIELDS:
                     self.tasks.unset(self.alias, field)
                 else:
                     self.help_unset()
@@ -5290,13 +5443,71 @@ class ModShell(Cmd):
         )
 
 
-def parse_args():
-    """Parse command line arguments.
+def expand_path(path):
+    """Expand a leading '~' and any environment variables in a path,
+    skipping the lookups when there is nothing to expand.
+
+    Args:
+        path (str): the path to expand.
+
+    Returns:
+        path (str): the expanded path.
+
+    """
+    if path.startswith('~'):
+        path = os.path.expanduser(path)
+    if '$' in path:
+        path = os.path.expandvars(path)
+    return path
+
+
+def parse_args(prune=True):
+    """Parse command line arguments. Only the parser for the requested
+    command is built, unless no known command was given (e.g., for
+    top-level help or an unknown command) in which case all of them
+    are built.
+
+    Args:
+        prune (bool):   only build the parser for the requested command.
 
     Returns:
         args (dict):    the command line arguments provided.
 
     """
+    command = None
+    if prune:
+        argv = iter(sys.argv[1:])
+        for arg in argv:
+            if arg == '-c' or (
+                    len(arg) > 2 and '--config'.startswith(arg)):
+                # skip the option value
+                next(argv, None)
+            elif not arg.startswith('-'):
+                command = arg
+                break
+            elif arg == '--' or arg.startswith('-h') or (
+                    len(arg) > 2 and '--help'.startswith(arg)):
+                break
+    matched = False
+
+    def wanted(*names):
+        """Check whether the parser for a command should be built.
+
+        Args:
+            names (str):    the command name and its aliases.
+
+        Returns:
+            (bool):     the parser should be built.
+
+        """
+        nonlocal matched
+        if command is None:
+            return True
+        elif command in names:
+            matched = True
+            return True
+        return False
+
     parser = argparse.ArgumentParser(
         prog=APP_NAME,
         description='Terminal-based task management for nerds.')
@@ -5311,337 +5522,323 @@ def parse_args():
         dest='page',
         action='store_true',
         help="page output")
-    archive = subparsers.add_parser(
-        'archive',
-        help='archive a task')
-    archive.add_argument(
-        'alias',
-        help='task alias')
-    archive.add_argument(
-        '-f',
-        '--force',
-        dest='force',
-        action='store_true',
-        help="archive without confirmation")
-    archive.set_defaults(command='archive')
-    complete = subparsers.add_parser(
-        'complete',
-        help='complete a task')
-    complete.add_argument(
-        'alias',
-        help='task alias')
-    complete.set_defaults(command='complete')
-    config = subparsers.add_parser(
-        'config',
-        help='edit configuration file')
-    config.set_defaults(command='config')
-    delete = subparsers.add_parser(
-        'delete',
-        aliases=['rm'],
-        help='delete a task file')
-    delete.add_argument(
-        'alias',
-        help='task alias')
-    delete.add_argument(
-        '-f',
-        '--force',
-        dest='force',
-        action='store_true',
-        help="delete without confirmation")
-    delete.set_defaults(command='delete')
-    edit = subparsers.add_parser(
-        'edit',
-        help='edit a task file (uses $EDITOR)')
-    edit.add_argument(
-        'alias',
-        help='task alias')
-    edit.set_defaults(command='edit')
-    export = subparsers.add_parser(
-        'export',
-        help='export tasks to iCalendar-formatted VTODO output')
-    export.add_argument(
-        'term',
-        help='search term')
-    export.set_defaults(command='export')
-    info = subparsers.add_parser(
-        'info',
-        parents=[pager],
-        help='show info about a task')
-    info.add_argument(
-        'alias',
-        help='the task to view')
-    info.set_defaults(command='info')
-    listcmd = subparsers.add_parser(
-        'list',
-        aliases=['ls'],
-        parents=[pager],
-        help='list tasks')
-    listcmd.add_argument(
-        'view',
-        help='list view (open, done, etc.) or <alias>')
-    listcmd.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    listcmd.set_defaults(command='list')
+    # shared option for the list views
+    if wanted('list', 'ls', *LIST_VIEW_ALIASES):
+        project = argparse.ArgumentParser(add_help=False)
+        project.add_argument(
+            '--project',
+            metavar='<project>',
+            help='show only tasks in project')
+    if wanted('archive'):
+        archive = subparsers.add_parser(
+            'archive',
+            help='archive a task')
+        archive.add_argument(
+            'alias',
+            help='task alias')
+        archive.add_argument(
+            '-f',
+            '--force',
+            dest='force',
+            action='store_true',
+            help="archive without confirmation")
+        archive.set_defaults(command='archive')
+    if wanted('complete'):
+        complete = subparsers.add_parser(
+            'complete',
+            help='complete a task')
+        complete.add_argument(
+            'alias',
+            help='task alias')
+        complete.set_defaults(command='complete')
+    if wanted('config'):
+        config = subparsers.add_parser(
+            'config',
+            help='edit configuration file')
+        config.set_defaults(command='config')
+    if wanted('delete', 'rm'):
+        delete = subparsers.add_parser(
+            'delete',
+            aliases=['rm'],
+            help='delete a task file')
+        delete.add_argument(
+            'alias',
+            help='task alias')
+        delete.add_argument(
+            '-f',
+            '--force',
+            dest='force',
+            action='store_true',
+            help="delete without confirmation")
+        delete.set_defaults(command='delete')
+    if wanted('edit'):
+        edit = subparsers.add_parser(
+            'edit',
+            help='edit a task file (uses $EDITOR)')
+        edit.add_argument(
+            'alias',
+            help='task alias')
+        edit.set_defaults(command='edit')
+    if wanted('export'):
+        export = subparsers.add_parser(
+            'export',
+            help='export tasks to iCalendar-formatted VTODO output')
+        export.add_argument(
+            'term',
+            help='search term')
+        export.set_defaults(command='export')
+    if wanted('info'):
+        info = subparsers.add_parser(
+            'info',
+            parents=[pager],
+            help='show info about a task')
+        info.add_argument(
+            'alias',
+            help='the task to view')
+        info.set_defaults(command='info')
+    if wanted('list', 'ls'):
+        listcmd = subparsers.add_parser(
+            'list',
+            aliases=['ls'],
+            parents=[pager, project],
+            help='list tasks')
+        listcmd.add_argument(
+            'view',
+            help='list view (open, done, etc.) or <alias>')
+        listcmd.set_defaults(command='list')
     # list shortcuts
-    lso = subparsers.add_parser('lso', parents=[pager])
-    lso.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lso.set_defaults(command='lso')
-    lss = subparsers.add_parser('lss', parents=[pager])
-    lss.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lss.set_defaults(command='lss')
-    lsl = subparsers.add_parser('lsl', parents=[pager])
-    lsl.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lsl.set_defaults(command='lsl')
-    lst = subparsers.add_parser('lst', parents=[pager])
-    lst.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lst.set_defaults(command='lst')
-    lsd = subparsers.add_parser('lsd', parents=[pager])
-    lsd.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lsd.set_defaults(command='lsd')
-    lsn = subparsers.add_parser('lsn', parents=[pager])
-    lsn.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lsn.set_defaults(command='lsn')
-    lsa = subparsers.add_parser('lsa', parents=[pager])
-    lsa.add_argument(
-        '--project',
-        metavar='<project>',
-        help='show only tasks in project')
-    lsa.set_defaults(command='lsa')
-    modify = subparsers.add_parser(
-        'modify',
-        aliases=['mod'],
-        help='modify a task')
-    modify.add_argument(
-        'alias',
-        help='the task to modify')
-    modify.add_argument(
-        '--completed',
-        metavar='<datetime>',
-        help='completed datetime: YYYY-mm-dd[ HH:MM]')
-    modify.add_argument(
-        '--description',
-        metavar='<description>',
-        help='task description')
-    modify.add_argument(
-        '--due',
-        metavar='<datetime>',
-        help='due datetime: YYYY-mm-dd[ HH:MM]')
-    modify.add_argument(
-        '--location',
-        metavar='<location>',
-        help='task location')
-    modify.add_argument(
-        '--notes',
-        metavar='<text>',
-        help='notes about the task')
-    modify.add_argument(
-        '--parent',
-        metavar='<alias>',
-        help='task is subtask of <alias>')
-    modify.add_argument(
-        '--percent',
-        metavar='<number>',
-        help='percent complete')
-    modify.add_argument(
-        '--priority',
-        metavar='<number>',
-        help='task priority')
-    modify.add_argument(
-        '--project',
-        metavar='<project>',
-        help='task project')
-    modify.add_argument(
-        '--rrule',
-        metavar='<rule>',
-        help='task recurrence rule')
-    modify.add_argument(
-        '--start',
-        metavar='<datetime>',
-        help='start datetime: YYYY-mm-dd[ HH:MM]')
-    modify.add_argument(
-        '--started',
-        metavar='<datetime>',
-        help='started datetime: YYYY-mm-dd[ HH:MM]')
-    modify.add_argument(
-        '--status',
-        metavar='<status>',
-        help='task status [done, todo, ...]')
-    modify.add_argument(
-        '--tags',
-        metavar='<tag>[,tag]',
-        help='task tag(s)')
-    modify.add_argument(
-        '--add-reminder',
-        metavar=('<datetime|expression>', 'display|email'),
-        nargs='+',
-        dest='add_reminder',
-        action='append',
-        help='add task reminder')
-    modify.add_argument(
-        '--del-reminder',
-        metavar='<index>',
-        dest='del_reminder',
-        action='append',
-        help='delete task reminder')
-    modify.set_defaults(command='modify')
-    new = subparsers.add_parser(
-        'new',
-        help='create a new task')
-    new.add_argument(
-        'description',
-        help='task description')
-    new.add_argument(
-        '--completed',
-        metavar='<datetime>',
-        help=r'completed datetime: YYYY-mm-dd[ HH:MM]')
-    new.add_argument(
-        '--due',
-        metavar='<datetime>',
-        help=r'due datetime: YYYY-mm-dd[ HH:MM]')
-    new.add_argument(
-        '--location',
-        metavar='<location>',
-        help='task location')
-    new.add_argument(
-        '--notes',
-        metavar='<text>',
-        help='notes about the task')
-    new.add_argument(
-        '--parent',
-        metavar='<alias>',
-        help='task is subtask of <alias>')
-    new.add_argument(
-        '--percent',
-        metavar='<number>',
-        help='task percent complete')
-    new.add_argument(
-        '--priority',
-        metavar='<number>',
-        help='task priority')
-    new.add_argument(
-        '--project',
-        metavar='<project>',
-        help='task project')
-    new.add_argument(
-        '--reminder',
-        metavar=('<datetime|expression>', 'display|email'),
-        nargs='+',
-        action='append',
-        dest='reminders',
-        help='reminder date/time or relative expression')
-    new.add_argument(
-        '--rrule',
-        metavar='<rule>',
-        help='task recurrence rule')
-    new.add_argument(
-        '--start',
-        metavar='<datetime>',
-        help=r'start datetime: YYYY-mm-dd[ HH:MM]')
-    new.add_argument(
-        '--started',
-        metavar='<datetime>',
-        help=r'started datetime: YYYY-mm-dd[ HH:MM]')
-    new.add_argument(
-        '--status',
-        metavar='<status>',
-        help='task status [done, todo, ...]')
-    new.add_argument(
-        '--tags',
-        metavar='<tag>[,tag]',
-        help='task tag(s)')
-    new.set_defaults(command='new')
-    notes = subparsers.add_parser(
-        'notes',
-        help='add/update notes on a task (uses $EDITOR)')
-    notes.add_argument(
-        'alias',
-        help='task alias')
-    notes.set_defaults(command='notes')
-    query = subparsers.add_parser(
-        'query',
-        help='search tasks with structured text output')
-    query.add_argument(
-        'term',
-        help='search term')
-    query.add_argument(
-        '-l',
-        '--limit',
-        dest='limit',
-        help='limit output to specific field(s)')
-    query.add_argument(
-        '-j',
-        '--json',
-        dest='json',
-        action='store_true',
-        help='output as JSON rather than TSV')
-    query.set_defaults(command='query')
-    reminders = subparsers.add_parser(
-        'reminders',
-        aliases=['rem'],
-        help='task reminders')
-    reminders.add_argument(
-        'interval',
-        help='reminder interval ([Xd][Yh][Zd])')
-    reminders.set_defaults(command='reminders')
-    search = subparsers.add_parser(
-        'search',
-        parents=[pager],
-        help='search tasks')
-    search.add_argument(
-        'term',
-        help='search term')
-    search.set_defaults(command='search')
-    shell = subparsers.add_parser(
-        'shell',
-        help='interactive shell')
-    shell.set_defaults(command='shell')
-    start = subparsers.add_parser(
-        'start',
-        help='start a task')
-    start.add_argument(
-        'alias',
-        help='task alias')
-    start.set_defaults(command='start')
-    unset = subparsers.add_parser(
-        'unset',
-        help='clear a field from a specified task')
-    unset.add_argument(
-        'alias',
-        help='task alias')
-    unset.add_argument(
-        'field',
-        help='field to clear')
-    unset.set_defaults(command='unset')
-    version = subparsers.add_parser(
-        'version',
-        help='show version info')
-    version.set_defaults(command='version')
+    for shortcut in ('lso', 'lss', 'lsl', 'lst', 'lsd', 'lsn', 'lsa'):
+        if wanted(shortcut):
+            lsx = subparsers.add_parser(
+                shortcut, parents=[pager, project])
+            lsx.set_defaults(command=shortcut)
+    if wanted('modify', 'mod'):
+        modify = subparsers.add_parser(
+            'modify',
+            aliases=['mod'],
+            help='modify a task')
+        modify.add_argument(
+            'alias',
+            help='the task to modify')
+        modify.add_argument(
+            '--completed',
+            metavar='<datetime>',
+            help='completed datetime: YYYY-mm-dd[ HH:MM]')
+        modify.add_argument(
+            '--description',
+            metavar='<description>',
+            help='task description')
+        modify.add_argument(
+            '--due',
+            metavar='<datetime>',
+            help='due datetime: YYYY-mm-dd[ HH:MM]')
+        modify.add_argument(
+            '--location',
+            metavar='<location>',
+            help='task location')
+        modify.add_argument(
+            '--notes',
+            metavar='<text>',
+            help='notes about the task')
+        modify.add_argument(
+            '--parent',
+            metavar='<alias>',
+            help='task is subtask of <alias>')
+        modify.add_argument(
+            '--percent',
+            metavar='<number>',
+            help='percent complete')
+        modify.add_argument(
+            '--priority',
+            metavar='<number>',
+            help='task priority')
+        modify.add_argument(
+            '--project',
+            metavar='<project>',
+            help='task project')
+        modify.add_argument(
+            '--rrule',
+            metavar='<rule>',
+            help='task recurrence rule')
+        modify.add_argument(
+            '--start',
+            metavar='<datetime>',
+            help='start datetime: YYYY-mm-dd[ HH:MM]')
+        modify.add_argument(
+            '--started',
+            metavar='<datetime>',
+            help='started datetime: YYYY-mm-dd[ HH:MM]')
+        modify.add_argument(
+            '--status',
+            metavar='<status>',
+            help='task status [done, todo, ...]')
+        modify.add_argument(
+            '--tags',
+            metavar='<tag>[,tag]',
+            help='task tag(s)')
+        modify.add_argument(
+            '--add-reminder',
+            metavar=('<datetime|expression>', 'display|email'),
+            nargs='+',
+            dest='add_reminder',
+            action='append',
+            help='add task reminder')
+        modify.add_argument(
+            '--del-reminder',
+            metavar='<index>',
+            dest='del_reminder',
+            action='append',
+            help='delete task reminder')
+        modify.set_defaults(command='modify')
+    if wanted('new'):
+        new = subparsers.add_parser(
+            'new',
+            help='create a new task')
+        new.add_argument(
+            'description',
+            help='task description')
+        new.add_argument(
+            '--completed',
+            metavar='<datetime>',
+            help=r'completed datetime: YYYY-mm-dd[ HH:MM]')
+        new.add_argument(
+            '--due',
+            metavar='<datetime>',
+            help=r'due datetime: YYYY-mm-dd[ HH:MM]')
+        new.add_argument(
+            '--location',
+            metavar='<location>',
+            help='task location')
+        new.add_argument(
+            '--notes',
+            metavar='<text>',
+            help='notes about the task')
+        new.add_argument(
+            '--parent',
+            metavar='<alias>',
+            help='task is subtask of <alias>')
+        new.add_argument(
+            '--percent',
+            metavar='<number>',
+            help='task percent complete')
+        new.add_argument(
+            '--priority',
+            metavar='<number>',
+            help='task priority')
+        new.add_argument(
+            '--project',
+            metavar='<project>',
+            help='task project')
+        new.add_argument(
+            '--reminder',
+            metavar=('<datetime|expression>', 'display|email'),
+            nargs='+',
+            action='append',
+            dest='reminders',
+            help='reminder date/time or relative expression')
+        new.add_argument(
+            '--rrule',
+            metavar='<rule>',
+            help='task recurrence rule')
+        new.add_argument(
+            '--start',
+            metavar='<datetime>',
+            help=r'start datetime: YYYY-mm-dd[ HH:MM]')
+        new.add_argument(
+            '--started',
+            metavar='<datetime>',
+            help=r'started datetime: YYYY-mm-dd[ HH:MM]')
+        new.add_argument(
+            '--status',
+            metavar='<status>',
+            help='task status [done, todo, ...]')
+        new.add_argument(
+            '--tags',
+            metavar='<tag>[,tag]',
+            help='task tag(s)')
+        new.set_defaults(command='new')
+    if wanted('notes'):
+        notes = subparsers.add_parser(
+            'notes',
+            help='add/update notes on a task (uses $EDITOR)')
+        notes.add_argument(
+            'alias',
+            help='task alias')
+        notes.set_defaults(command='notes')
+    if wanted('query'):
+        query = subparsers.add_parser(
+            'query',
+            help='search tasks with structured text output')
+        query.add_argument(
+            'term',
+            help='search term')
+        query.add_argument(
+            '-l',
+            '--limit',
+            dest='limit',
+            help='limit output to specific field(s)')
+        query.add_argument(
+            '-j',
+            '--json',
+            dest='json',
+            action='store_true',
+            help='output as JSON rather than TSV')
+        query.set_defaults(command='query')
+    if wanted('reminders', 'rem'):
+        reminders = subparsers.add_parser(
+            'reminders',
+            aliases=['rem'],
+            help='task reminders')
+        reminders.add_argument(
+            'interval',
+            help='reminder interval ([Xd][Yh][Zd])')
+        reminders.set_defaults(command='reminders')
+    if wanted('search'):
+        search = subparsers.add_parser(
+            'search',
+            parents=[pager],
+            help='search tasks')
+        search.add_argument(
+            'term',
+            help='search term')
+        search.set_defaults(command='search')
+    if wanted('shell'):
+        shell = subparsers.add_parser(
+            'shell',
+            help='interactive shell')
+        shell.set_defaults(command='shell')
+    if wanted('start'):
+        start = subparsers.add_parser(
+            'start',
+            help='start a task')
+        start.add_argument(
+            'alias',
+            help='task alias')
+        start.set_defaults(command='start')
+    if wanted('unset'):
+        unset = subparsers.add_parser(
+            'unset',
+            help='clear a field from a specified task')
+        unset.add_argument(
+            'alias',
+            help='task alias')
+        unset.add_argument(
+            'field',
+            help='field to clear')
+        unset.set_defaults(command='unset')
+    if wanted('version'):
+        version = subparsers.add_parser(
+            'version',
+            help='show version info')
+        version.set_defaults(command='version')
     parser.add_argument(
         '-c',
         '--config',
         dest='config',
         metavar='<file>',
         help='config file')
+    if command is not None and not matched:
+        return parse_args(prune=False)
     args = parser.parse_args()
     return parser, args
 
@@ -5653,35 +5850,44 @@ def main():
     """
     if os.environ.get("XDG_CONFIG_HOME"):
         config_file = os.path.join(
-            os.path.expandvars(os.path.expanduser(
-                os.environ["XDG_CONFIG_HOME"])), APP_NAME, "config")
+            expand_path(os.environ["XDG_CONFIG_HOME"]), APP_NAME, "config")
     else:
-        config_file = os.path.expandvars(
-            os.path.expanduser(DEFAULT_CONFIG_FILE))
+        config_file = expand_path(DEFAULT_CONFIG_FILE)
 
     if os.environ.get("XDG_DATA_HOME"):
         data_dir = os.path.join(
-            os.path.expandvars(os.path.expanduser(
-                os.environ["XDG_DATA_HOME"])), APP_NAME)
+            expand_path(os.environ["XDG_DATA_HOME"]), APP_NAME)
+    else:
+        data_dir = expand_path(DEFAULT_DATA_DIR)
+
+    if os.environ.get("XDG_CACHE_HOME"):
+        cache_dir = os.path.join(
+            expand_path(os.environ["XDG_CACHE_HOME"]), APP_NAME)
     else:
-        data_dir = os.path.expandvars(
-            os.path.expanduser(DEFAULT_DATA_DIR))
+        cache_dir = expand_path(DEFAULT_CACHE_DIR)
 
     parser, args = parse_args()
 
     if args.config:
-        config_file = os.path.expandvars(
-            os.path.expanduser(args.config))
+        config_file = expand_path(args.config)
+
+    # commands that don't need the task data
+    if not args.command:
+        parser.print_help(sys.stderr)
+        sys.exit(1)
+    elif args.command == "version":
+        print(f"{APP_NAME} {APP_VERS}")
+        print(APP_COPYRIGHT)
+        print(APP_LICENSE)
+        return
 
     tasks = Tasks(
         config_file,
         data_dir,
-        DEFAULT_CONFIG)
+        DEFAULT_CONFIG,
+        os.path.join(cache_dir, "tasks.cache"))
 
-    if not args.command:
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-    elif args.command == "config":
+    if args.command == "config":
         tasks.edit_config()
     elif args.command == "modify":
         tasks.modify(
@@ -5725,20 +5931,11 @@ def main():
         tasks.reminders(args.interval)
     elif args.command == "list":
         tasks.list(args.view, pager=args.page, project=args.project)
-    elif args.command == "lso":
-        tasks.list('open', pager=args.page, project=args.project)
-    elif args.command == "lsl":
-        tasks.list('late', pager=args.page, project=args.project)
-    elif args.command == "lss":
-        tasks.list('soon', pager=args.page, project=args.project)
-    elif args.command == "lst":
-        tasks.list('today', pager=args.page, project=args.project)
-    elif args.command == "lsa":
-        tasks.list('all', pager=args.page, project=args.project)
-    elif args.command == "lsn":
-        tasks.list('nosubs', pager=args.page, project=args.project)
-    elif args.command == "lsd":
-        tasks.list('done', pager=args.page, project=args.project)
+    elif args.command in LIST_VIEW_ALIASES:
+        tasks.list(
+            LIST_VIEW_ALIASES[args.command],
+            pager=args.page,
+            project=args.project)
     elif args.command == "delete":
         tasks.delete(args.alias, args.force)
     elif args.command == "edit":
@@ -5763,10 +5960,6 @@ def main():
         tasks.interactive = True
         shell = TasksShell(tasks)
         shell.cmdloop()
-    elif args.command == "version":
-        print(f"{APP_NAME} {APP_VERS}")
-        print(APP_COPYRIGHT)
-        print(APP_LICENSE)
     else:
         sys.exit(1)
 